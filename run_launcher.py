@@ -20,8 +20,16 @@ LAUNCHER_MAP = {
 def main():
     parser = argparse.ArgumentParser(description="Unified OpenScope Launcher")
     parser.add_argument("--param_file", required=True, help="Path to parameter JSON file")
+    parser.add_argument(
+        "--yes",
+        action="store_true",
+        help="Accept default answers for all launcher prompts (sets OSL_NONINTERACTIVE=1)",
+    )
     args = parser.parse_args()
 
+    if args.yes:
+        os.environ["OSL_NONINTERACTIVE"] = "1"
+
     # Load params
     with open(args.param_file, 'r') as f:
         params = json.load(f)
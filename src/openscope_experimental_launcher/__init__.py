@@ -5,28 +5,58 @@ A Python package for launching OpenScope experiments with modular architecture,
 supporting Bonsai, MATLAB, and Python workflows.
 """
 
-from importlib import metadata
-
-try:
-    __version__ = metadata.version("openscope-experimental-launcher")
-except metadata.PackageNotFoundError:  # pragma: no cover - local source tree
-    __version__ = "0.0.0"
-
-# Import main launcher classes for easy access
-from .launchers.base_launcher import BaseLauncher
-from .launchers.bonsai_launcher import BonsaiLauncher
-from .launchers.matlab_launcher import MatlabLauncher
-from .launchers.python_launcher import PythonLauncher
-# Import interface modules
-from .interfaces import bonsai_interface, matlab_interface, python_interface
-import sys
+import importlib
 import os
+import sys
 
 # Add scripts directory to path
 scripts_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'scripts')
 if scripts_path not in sys.path:
     sys.path.insert(0, scripts_path)
 
+# Launcher classes and interface modules are imported on first access (PEP 562) so
+# that importing one submodule (e.g. a post-acquisition tool) does not pull in
+# every launcher and its dependencies.
+_LAZY_ATTRS = {
+    "BaseLauncher": (".launchers.base_launcher", "BaseLauncher"),
+    "BonsaiLauncher": (".launchers.bonsai_launcher", "BonsaiLauncher"),
+    "MatlabLauncher": (".launchers.matlab_launcher", "MatlabLauncher"),
+    "PythonLauncher": (".launchers.python_launcher", "PythonLauncher"),
+    "bonsai_interface": (".interfaces.bonsai_interface", None),
+    "matlab_interface": (".interfaces.matlab_interface", None),
+    "python_interface": (".interfaces.python_interface", None),
+}
+
+
+def _resolve_version():
+    # importlib.metadata is costly to import, so it is only loaded when the version is asked for.
+    from importlib import metadata
+
+    try:
+        return metadata.version("openscope-experimental-launcher")
+    except metadata.PackageNotFoundError:  # pragma: no cover - local source tree
+        return "0.0.0"
+
+
+def __getattr__(name):
+    if name == "__version__":
+        value = globals()["__version__"] = _resolve_version()
+        return value
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = importlib.import_module(module_name, __name__)
+    if attr is not None:
+        value = getattr(value, attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
 __all__ = [
     "BaseLauncher",
     "BonsaiLauncher", 
@@ -6,11 +6,24 @@ interactions, package management, and workflow execution.
 """
 
 import os
+import sys
 import logging
 import subprocess
 import xml.etree.ElementTree as ET
 from typing import Dict, List, Optional, Any
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+# Size used for both the user-space pipe buffer and (on Linux) the kernel pipe
+# capacity, so bursty Bonsai output does not stall on a full pipe.
+PIPE_BUFFER_SIZE = 1 << 20
+
+# F_SETPIPE_SZ is only exposed by the fcntl module on Python 3.10+.
+_F_SETPIPE_SZ = getattr(fcntl, "F_SETPIPE_SZ", 1031) if fcntl else None
+
 
 def setup_bonsai_environment(params: Dict[str, Any]) -> bool:
     """
@@ -396,7 +409,30 @@ def construct_workflow_arguments(params: Dict[str, Any]) -> List[str]:
     return args
 
 
-def start_workflow(workflow_path: str, bonsai_exe_path: str, arguments: List[str] = None, output_folder: str = None) -> subprocess.Popen:
+def _enlarge_pipe_buffers(process: subprocess.Popen, size: int = PIPE_BUFFER_SIZE) -> None:
+    """
+    Grow the kernel buffers of the child's stdout/stderr pipes where supported.
+
+    This is best effort: it only applies on Linux and silently keeps the OS
+    default when the request is refused (e.g. above /proc/sys/fs/pipe-max-size).
+
+    Args:
+        process: Running subprocess whose pipes should be enlarged
+        size: Requested pipe capacity in bytes
+    """
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return
+    for stream in (process.stdout, process.stderr):
+        if stream is None:
+            continue
+        try:
+            fcntl.fcntl(stream.fileno(), _F_SETPIPE_SZ, size)
+        except (OSError, ValueError):
+            pass
+
+
+def start_workflow(workflow_path: str, bonsai_exe_path: str, arguments: List[str] = None, output_folder: str = None,
+                   stdout_log: Optional[str] = None, stderr_log: Optional[str] = None) -> subprocess.Popen:
     """
     Start a Bonsai workflow as a subprocess.
     
@@ -405,6 +441,9 @@ def start_workflow(workflow_path: str, bonsai_exe_path: str, arguments: List[str
         bonsai_exe_path: Path to Bonsai executable
         arguments: Additional command-line arguments
         output_folder: Directory for output files
+        stdout_log: Optional file that receives the child's stdout directly (appended).
+            When set, ``process.stdout`` is None and nothing is piped through Python.
+        stderr_log: Optional file that receives the child's stderr directly (appended).
         
     Returns:
         Subprocess.Popen object for the running workflow
@@ -437,14 +476,27 @@ def start_workflow(workflow_path: str, bonsai_exe_path: str, arguments: List[str
     
     logging.info(f"Starting Bonsai workflow: {' '.join(cmd_args)}")
     
+    log_files = []
     try:
+        # Streams redirected to a file are written by the OS directly; the rest use
+        # binary, block-buffered pipes drained by the launcher's reader threads.
+        streams = []
+        for log_path in (stdout_log, stderr_log):
+            if log_path:
+                os.makedirs(os.path.dirname(os.path.abspath(log_path)), exist_ok=True)
+                log_file = open(log_path, 'ab')
+                log_files.append(log_file)
+                streams.append(log_file)
+            else:
+                streams.append(subprocess.PIPE)
+
         process = subprocess.Popen(
             cmd_args,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            universal_newlines=True,
-            bufsize=1
+            stdout=streams[0],
+            stderr=streams[1],
+            bufsize=PIPE_BUFFER_SIZE
         )
+        _enlarge_pipe_buffers(process)
         
         logging.info(f"Bonsai workflow started with PID: {process.pid}")
         return process
@@ -452,3 +504,7 @@ def start_workflow(workflow_path: str, bonsai_exe_path: str, arguments: List[str
     except Exception as e:
         logging.error(f"Failed to start Bonsai workflow: {e}")
         raise
+    finally:
+        # The child holds its own handles; the parent's copies are no longer needed.
+        for log_file in log_files:
+            log_file.close()
@@ -239,8 +239,48 @@ def _default_entrypoint_args(entry_point: Optional[str]) -> List[Any]:
     return []
 
 
+# Live engine connections kept for reuse across launches (engine name -> engine).
+# Only populated for requests with keep_engine_alive.
+_ENGINE_CACHE: Dict[str, Any] = {}
+_ENGINE_CACHE_LOCK = threading.Lock()
+
+
+def _engine_responds(engine: Any) -> bool:
+    """Return True if a cached engine connection still answers a trivial command."""
+
+    try:
+        engine.eval("1;", nargout=0)
+        return True
+    except Exception:
+        return False
+
+
+def _take_cached_engine(engine_name: str) -> Optional[Any]:
+    with _ENGINE_CACHE_LOCK:
+        engine = _ENGINE_CACHE.get(engine_name)
+    if engine is None:
+        return None
+    if _engine_responds(engine):
+        return engine
+    with _ENGINE_CACHE_LOCK:
+        if _ENGINE_CACHE.get(engine_name) is engine:
+            del _ENGINE_CACHE[engine_name]
+    return None
+
+
 def connect_shared_engine(request: MatlabLaunchRequest) -> Any:
-    """Attach to an already shared MATLAB engine."""
+    """Attach to an already shared MATLAB engine.
+
+    When ``request.keep_engine_alive`` is set, a connection from an earlier
+    launch in this process is reused if it still responds, which skips the
+    (potentially long) connection wait.
+    """
+
+    if request.keep_engine_alive:
+        cached = _take_cached_engine(request.engine_name)
+        if cached is not None:
+            logging.info("Reusing connection to shared MATLAB engine '%s'", request.engine_name)
+            return cached
 
     matlab_engine = _ensure_matlab_engine()
 
@@ -259,6 +299,9 @@ def connect_shared_engine(request: MatlabLaunchRequest) -> Any:
                 request.engine_name,
                 attempt,
             )
+            if request.keep_engine_alive:
+                with _ENGINE_CACHE_LOCK:
+                    _ENGINE_CACHE[request.engine_name] = engine
             return engine
         except matlab_engine.EngineError as exc:  # pragma: no cover - depends on MATLAB runtime
             last_error = exc
@@ -969,9 +1012,14 @@ def _dispatch_matlab_feval(
 
 def cleanup_engine(
     engine: Optional[Any],
-    process: Optional[MatlabEngineProcess]
+    process: Optional[MatlabEngineProcess],
+    keep_alive: bool = False,
     ) -> None:
-    """Release engine resources after the launcher completes."""
+    """Release engine resources after the launcher completes.
+
+    With ``keep_alive`` a connection held in the reuse cache is left open for
+    the next launch; otherwise it is evicted and disconnected.
+    """
 
     if process is not None:
         process.close_streams()
@@ -979,6 +1027,13 @@ def cleanup_engine(
     if engine is None:
         return
 
+    with _ENGINE_CACHE_LOCK:
+        cached_name = next((name for name, cached in _ENGINE_CACHE.items() if cached is engine), None)
+        if cached_name is not None:
+            if keep_alive:
+                return
+            del _ENGINE_CACHE[cached_name]
+
     try:  
         quit_fn = getattr(engine, "quit", None)
         if callable(quit_fn):
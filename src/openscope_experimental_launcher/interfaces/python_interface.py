@@ -9,7 +9,14 @@ import os
 import sys
 import logging
 import subprocess
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+
+
+# Interpreters already verified by check_installation in this process
+_VERIFIED_INTERPRETERS = set()
+
+# Resolved virtual environments: venv_path -> (pyvenv.cfg mtime, (python executable, scripts dir))
+_VENV_CACHE: Dict[str, Tuple[int, Tuple[str, str]]] = {}
 
 
 def setup_python_environment(params: Dict[str, Any]) -> bool:
@@ -51,6 +58,10 @@ def check_installation(python_exe_path: str = None) -> bool:
     """
     if python_exe_path is None:
         python_exe_path = sys.executable
+
+    # The running interpreter, or one verified earlier, needs no extra subprocess.
+    if python_exe_path == sys.executable or python_exe_path in _VERIFIED_INTERPRETERS:
+        return True
     
     try:
         # Try to run Python with version flag
@@ -63,6 +74,7 @@ def check_installation(python_exe_path: str = None) -> bool:
         
         if result.returncode == 0:
             logging.info(f"Python installation verified: {result.stdout.strip()}")
+            _VERIFIED_INTERPRETERS.add(python_exe_path)
             return True
         else:
             logging.warning(f"Python check failed with return code: {result.returncode}")
@@ -73,27 +85,63 @@ def check_installation(python_exe_path: str = None) -> bool:
         return False
 
 
-def activate_virtual_environment(venv_path: str) -> bool:
+def resolve_virtual_environment(venv_path: str) -> Optional[Tuple[str, str]]:
     """
-    Activate a Python virtual environment.
+    Locate the interpreter and scripts directory of a virtual environment.
+    
+    The result is cached per process until the venv's ``pyvenv.cfg`` changes,
+    so repeated launches cost one stat instead of probing several paths.
     
     Args:
         venv_path: Path to the virtual environment
         
     Returns:
-        True if activation successful, False otherwise
+        (python executable, scripts directory) tuple, or None if not a usable venv
     """
+    try:
+        cfg_mtime = os.stat(os.path.join(venv_path, 'pyvenv.cfg')).st_mtime_ns
+    except OSError:
+        cfg_mtime = None
+    cached = _VENV_CACHE.get(venv_path)
+    if cached is not None and cached[0] == cfg_mtime:
+        return cached[1]
+
     if not os.path.exists(venv_path):
         logging.error(f"Virtual environment not found: {venv_path}")
-        return False
-    
-    # Check for activation script
-    activate_script = os.path.join(venv_path, 'Scripts', 'activate.bat')  # Windows
+        return None
+    
+    # The interpreter is what gets launched; the activate script is never run
+    scripts_dir = os.path.join(venv_path, 'Scripts')  # Windows
+    venv_python = os.path.join(scripts_dir, 'python.exe')
+    activate_script = os.path.join(scripts_dir, 'activate.bat')
+    if not os.path.exists(venv_python):
+        scripts_dir = os.path.join(venv_path, 'bin')  # Unix/Linux
+        venv_python = os.path.join(scripts_dir, 'python')
+        activate_script = os.path.join(scripts_dir, 'activate')
+    
+    if not os.path.exists(venv_python):
+        logging.error(f"Virtual environment Python not found: {venv_python}")
+        return None
     if not os.path.exists(activate_script):
-        activate_script = os.path.join(venv_path, 'bin', 'activate')  # Unix/Linux
+        logging.info(f"Virtual environment has no activation script: {activate_script}")
+
+    resolved = (venv_python, scripts_dir)
+    if cfg_mtime is not None:
+        _VENV_CACHE[venv_path] = (cfg_mtime, resolved)
+    return resolved
+
+
+def activate_virtual_environment(venv_path: str) -> bool:
+    """
+    Activate a Python virtual environment.
     
-    if not os.path.exists(activate_script):
-        logging.error(f"Virtual environment activation script not found: {activate_script}")
+    Args:
+        venv_path: Path to the virtual environment
+        
+    Returns:
+        True if activation successful, False otherwise
+    """
+    if resolve_virtual_environment(venv_path) is None:
         return False
     
     logging.info(f"Virtual environment found: {venv_path}")
@@ -146,15 +194,11 @@ def start_python_script(script_path: str, python_exe_path: str = None,
         raise FileNotFoundError(f"Python script not found: {script_path}")
     
     # Determine Python executable
-    if venv_path and os.path.exists(venv_path):
+    venv = resolve_virtual_environment(venv_path) if venv_path else None
+    if venv is not None:
         # Use virtual environment's Python
-        venv_python = os.path.join(venv_path, 'Scripts', 'python.exe')  # Windows
-        if not os.path.exists(venv_python):
-            venv_python = os.path.join(venv_path, 'bin', 'python')  # Unix/Linux
-        
-        if os.path.exists(venv_python):
-            python_exe_path = venv_python
-            logging.info(f"Using virtual environment Python: {python_exe_path}")
+        python_exe_path = venv[0]
+        logging.info(f"Using virtual environment Python: {python_exe_path}")
     
     if python_exe_path is None:
         python_exe_path = sys.executable
@@ -164,10 +208,20 @@ def start_python_script(script_path: str, python_exe_path: str = None,
     
     if arguments:
         cmd_args.extend(arguments)
-      # Set environment variables
-    env = os.environ.copy()
+      # Set environment variables; the child inherits os.environ unchanged (no copy)
+    # unless something has to be added
+    env = None
+    
+    if venv is not None:
+        # Same variables the activate script sets, without running it
+        env = os.environ.copy()
+        env['VIRTUAL_ENV'] = os.path.abspath(venv_path)
+        env['PATH'] = venv[1] + os.pathsep + env.get('PATH', '')
+        env.pop('PYTHONHOME', None)
     
     if output_folder:
+        if env is None:
+            env = os.environ.copy()
         env['OUTPUT_FOLDER'] = output_folder
         logging.info(f"Output folder set as environment variable: {output_folder}")
     
@@ -4,10 +4,30 @@ OpenScope Experimental Launcher - Launchers Module
 This module provides interface-specific launchers for different experimental environments.
 """
 
-from .base_launcher import BaseLauncher
-from .bonsai_launcher import BonsaiLauncher
-from .matlab_launcher import MatlabLauncher
-from .python_launcher import PythonLauncher
+import importlib
+
+# Imported on first access (PEP 562); using one launcher does not import the others.
+_LAZY_ATTRS = {
+    'BaseLauncher': '.base_launcher',
+    'BonsaiLauncher': '.bonsai_launcher',
+    'MatlabLauncher': '.matlab_launcher',
+    'PythonLauncher': '.python_launcher',
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     'BaseLauncher',
@@ -20,8 +20,13 @@ import datetime
 import platform
 import psutil
 import json
+import locale
 import subprocess
+import select
+import concurrent.futures
 import threading
+import functools
+import collections
 import importlib
 import importlib.util
 from importlib import metadata as importlib_metadata
@@ -41,6 +46,17 @@ if os.name == "nt":  # pragma: no cover - Windows-specific imports
         win32file = None
 
 
+# Child processes (Bonsai on Windows in particular) write in the locale code page, which
+# text-mode pipes used to decode with; keep doing so now that pipes are binary.
+_OUTPUT_ENCODING = locale.getpreferredencoding(False)
+
+_CONSOLE_LOG_FORMATTER = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_FILE_LOG_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+
 class _PlaceholderDict(dict):
     """Format-friendly dict that leaves unknown keys untouched."""
 
@@ -118,6 +134,7 @@ from ..utils import param_utils
 from ..utils import schema_validator
 from ..utils import session_sync as session_sync_utils
 from ..utils import github_issue_reporter
+from ..utils import json_utils
 from .. import __version__
 
 try:
@@ -132,6 +149,145 @@ except Exception:  # pragma: no cover
     _PACKAGING_AVAILABLE = False
 
 
+def _is_mock(obj) -> bool:
+    """Return True if ``obj`` is a unittest.mock object (test stand-in for a pipe)."""
+    # Nothing can be a Mock unless unittest.mock was imported, so production
+    # runs skip the check without importing it.
+    mock = sys.modules.get("unittest.mock")
+    return mock is not None and isinstance(obj, mock.NonCallableMock)
+
+
+def _open_exit_waiter(proc):
+    """Return an OS object that signals when ``proc`` exits, if supported.
+
+    This is a pidfd on Linux 5.3+ (Python 3.9+) or a kqueue watching
+    NOTE_EXIT on macOS/BSD; None elsewhere. Release it with _close_exit_waiter.
+    """
+    if not isinstance(proc, subprocess.Popen):
+        return None
+    try:
+        if hasattr(os, "pidfd_open"):
+            return os.pidfd_open(proc.pid)
+        if hasattr(select, "kqueue"):
+            kq = select.kqueue()
+            try:
+                kq.control([select.kevent(
+                    proc.pid,
+                    filter=select.KQ_FILTER_PROC,
+                    flags=select.KQ_EV_ADD,
+                    fflags=select.KQ_NOTE_EXIT,
+                )], 0)
+            except OSError:
+                kq.close()
+                raise
+            return kq
+    except OSError:
+        # Already reaped or unsupported by the kernel; fall back to sleeping.
+        return None
+    return None
+
+
+def _close_exit_waiter(waiter) -> None:
+    if waiter is None:
+        return
+    if isinstance(waiter, int):
+        os.close(waiter)
+    else:
+        waiter.close()
+
+
+def _wait_for_exit(proc, timeout: float, waiter=None) -> None:
+    """Sleep up to ``timeout`` seconds, returning as soon as ``proc`` exits.
+
+    Uses the waiter from _open_exit_waiter where available and Popen.wait
+    (WaitForSingleObject) on Windows; anything else (including test doubles)
+    falls back to a plain sleep.
+    """
+    if isinstance(waiter, int):
+        select.select([waiter], [], [], timeout)
+        return
+    if waiter is not None:
+        waiter.control(None, 1, timeout)
+        return
+    if os.name == "nt" and isinstance(proc, subprocess.Popen):
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            pass
+        return
+    time.sleep(timeout)
+
+
+# Trailer of resource_usage.json; new samples are written over it
+_JSON_ARRAY_END = b"\n]\n"
+
+
+def _resource_sample_json(entry: dict) -> bytes:
+    """Serialize one resource_usage.json sample in a fixed compact format."""
+    return json.dumps(entry, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _write_json_documents(documents) -> None:
+    """Write several JSON files with one write each, then fsync them together.
+
+    Each file is written to ``<path>.tmp`` and moved into place with
+    ``os.replace`` once all of them are on disk, so an interrupted launcher
+    never leaves a truncated metadata file. If a rename still fails, the
+    ``.tmp`` files not yet moved into place are removed before re-raising.
+
+    Args:
+        documents: Iterable of ``(path, payload)`` pairs.
+    """
+    handles = []
+    renames = []
+    try:
+        for path, payload in documents:
+            data = json_utils.dumps(payload, default=str)
+            tmp_path = f"{path}.tmp"
+            f = open(tmp_path, "wb")
+            handles.append(f)
+            renames.append((tmp_path, path))
+            f.write(data)
+        for f in handles:
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        for f in handles:
+            f.close()
+        for tmp_path, _ in renames:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        raise
+    for f in handles:
+        f.close()
+    done = 0
+    try:
+        for tmp_path, path in renames:
+            # Windows can transiently lock the target; retry a few times before giving up.
+            for attempt in range(3):
+                try:
+                    os.replace(tmp_path, path)
+                    break
+                except PermissionError:
+                    time.sleep(0.2 * (attempt + 1))
+            else:
+                os.replace(tmp_path, path)
+            done += 1
+    except BaseException:
+        for tmp_path, _ in renames[done:]:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        raise
+
+
+def _init_batch_worker() -> None:
+    """Make BaseLauncher.run_batch workers accept prompt defaults instead of blocking."""
+    os.environ[param_utils.NONINTERACTIVE_ENV_VAR] = "1"
+
 
 class BaseLauncher:
     """
@@ -165,6 +321,10 @@ class BaseLauncher:
         self.start_time = None
         self.stop_time = None
         self._sigint_received = False
+        # Set by stop(); lets waits between attempts end as soon as a stop is requested
+        self._stop_event = threading.Event()
+        self._prev_sigint_handler = None
+        self._sigint_handler_installed = False
         self.config = {}
         self._log_level = logging.getLogger().getEffectiveLevel()
         
@@ -176,14 +336,42 @@ class BaseLauncher:
         
         # Version tracking
         self._version = __version__
+
+        # Cached (inputs, result) of git_manager.get_repository_path; see _get_repo_path
+        self._repo_path_cache: Optional[tuple] = None
+        # (path, repository path) -> resolved path; see _resolve_repo_relative
+        self._repo_relative_cache: Dict[tuple, str] = {}
+        # Script paths already confirmed to exist; see _script_file_exists
+        self._known_script_files: set = set()
         
         # Process management (common to all interfaces)
         self.process = None
-        self.stdout_data = []
-        self.stderr_data = []
+        # Bounded ring buffers holding the most recent output lines (see _new_output_buffer)
+        self.stdout_data = self._new_output_buffer()
+        self.stderr_data = self._new_output_buffer()
         self._output_threads = []
-        self._percent_used = None        # Logging state
+        # Set once every output reader has hit EOF (nothing to drain initially)
+        self._output_drained = threading.Event()
+        self._output_drained.set()
+        self._readers_remaining = 0
+        self._readers_lock = threading.Lock()
+        # Files receiving child output directly (stream -> path) and the byte offset
+        # at which the current attempt's output starts
+        self._output_log_paths: Dict[str, str] = {}
+        self._output_log_offsets: Dict[str, int] = {}
+        # Set by _on_output_line overrides when a line marks the attempt as failed
+        self._failure_reason: Optional[str] = None
+        # time.monotonic() of the first stderr output of the current attempt (None until seen)
+        self._first_stderr_ts: Optional[float] = None
+        # Logging state
         self._logging_finalized = False  # Flag to prevent duplicate logging
+        # Resource logging (see _start_resource_logging)
+        self._resource_log_thread = None
+        self._resource_log_stop = None
+        self._resource_log_data = []
+        # Per-pipeline stage outcomes recorded by _run_stage
+        self._stage_abort: Dict[str, bool] = {}
+        self._stage_failures: Dict[str, list] = {}
         
         # Initialize launcher by loading all required configuration and data
         # This performs three key initialization steps:
@@ -249,6 +437,28 @@ class BaseLauncher:
         logging.info(f"Using rig: {self.rig_config['rig_id']}")
         logging.info("BaseLauncher initialized")
 
+    def _install_sigint_handler(self) -> None:
+        """Route SIGINT to signal_handler for the duration of run(); no-op off the main thread."""
+        if self._sigint_handler_installed:
+            return
+        if threading.current_thread() is not threading.main_thread():
+            return
+        self._prev_sigint_handler = signal.getsignal(signal.SIGINT)
+        signal.signal(signal.SIGINT, self.signal_handler)
+        self._sigint_handler_installed = True
+
+    def _restore_sigint_handler(self) -> None:
+        """Restore the SIGINT handler that was active before this launcher installed its own."""
+        if not self._sigint_handler_installed:
+            return
+        if threading.current_thread() is not threading.main_thread():
+            return
+        # SIG_DFL is 0 (falsy), so test for None: getsignal() returns None only for a
+        # handler that was not installed from Python.
+        prev = self._prev_sigint_handler
+        signal.signal(signal.SIGINT, prev if prev is not None else signal.default_int_handler)
+        self._sigint_handler_installed = False
+
 
     def _enforce_param_launcher_version(self) -> None:
         """Enforce optional `launcher_version` specifier from the param file.
@@ -311,17 +521,49 @@ class BaseLauncher:
             "computer_name": platform.node(),
         }
 
+    def _get_repo_path(self) -> Optional[str]:
+        """Return the workflow repository path, reusing it while the repository params are unchanged."""
+        cache_key = (self.params.get('local_repository_path'), self.params.get('repository_url'))
+        if self._repo_path_cache is None or self._repo_path_cache[0] != cache_key:
+            self._repo_path_cache = (cache_key, git_manager.get_repository_path(self.params))
+        return self._repo_path_cache[1]
+
+    def _resolve_repo_relative(self, path: str) -> str:
+        """Resolve ``path`` against the workflow repository unless it is absolute.
+
+        Results are memoized per (path, repository path), so retries reuse them.
+        """
+        repo_root = self._get_repo_path()
+        cache_key = (path, repo_root)
+        resolved = self._repo_relative_cache.get(cache_key)
+        if resolved is None:
+            if os.path.isabs(path) or not repo_root:
+                resolved = path
+            else:
+                resolved = os.path.join(repo_root, path)
+            self._repo_relative_cache[cache_key] = resolved
+        return resolved
+
+    def _script_file_exists(self, path: str) -> bool:
+        """Return os.path.isfile(path), skipping the stat for paths already found.
+
+        Only positive results are remembered, so a missing file is re-checked on
+        every attempt. Set ``recheck_script_path`` to always stat the file.
+        """
+        if path in self._known_script_files and not self.params.get('recheck_script_path'):
+            return True
+        exists = os.path.isfile(path)
+        if exists:
+            self._known_script_files.add(path)
+        return exists
+
     def _get_script_path(self) -> str:
         """Resolve and validate script_path parameter (generic for Python/Matlab)."""
         script_path = self.params.get('script_path')
         if not script_path:
             raise RuntimeError("Missing 'script_path' parameter")
-        if os.path.isabs(script_path):
-            candidate = script_path
-        else:
-            repo_root = git_manager.get_repository_path(self.params)
-            candidate = os.path.join(repo_root, script_path) if repo_root else script_path
-        if not os.path.isfile(candidate):
+        candidate = self._resolve_repo_relative(script_path)
+        if not self._script_file_exists(candidate):
             raise RuntimeError(f"Script not found: {candidate}")
         return candidate
 
@@ -549,19 +791,12 @@ class BaseLauncher:
             metadata_dir = os.path.join(output_directory, "launcher_metadata")
             os.makedirs(metadata_dir, exist_ok=True)
             
-            # 1. Save original input parameters from JSON file
+            # Collect every document first so they can be written and synced as one batch.
+            # 1. Original input parameters from JSON file
             input_params_file = os.path.join(metadata_dir, "input_parameters.json")
-            with open(input_params_file, 'w') as f:
-                json.dump(self.original_input_params, f, indent=2, default=str)
-            logging.info(f"Saved original input parameters to: {input_params_file}")
-            
-            # 2. Save processed input parameters (original params + rig config)           
+            # 2. Processed input parameters (original params + rig config)
             processed_params_file = os.path.join(metadata_dir, "processed_parameters.json")
-            with open(processed_params_file, 'w') as f:
-                json.dump(self.params, f, indent=2, default=str)
-            logging.info(f"Saved processed parameters to: {processed_params_file}")
-            
-            # 3. Save command line arguments
+            # 3. Command line arguments
             cmdline_file = os.path.join(metadata_dir, "command_line_arguments.json")
             cmdline_info = {
                 "command_line": " ".join(sys.argv),
@@ -571,56 +806,71 @@ class BaseLauncher:
                 "original_param_file": self.original_param_file,
                 "timestamp": datetime.datetime.now().isoformat()
             }
-            with open(cmdline_file, 'w') as f:
-                json.dump(cmdline_info, f, indent=2)
-            logging.info(f"Saved command line info to: {cmdline_file}")
-
-            # 4. Record git commit hashes for provenance
-            git_entries = []
-
-            # Workflow repository (if configured and is a git repo)
-            repo_path = git_manager.get_repository_path(self.params)
-            if repo_path and Path(repo_path, ".git").exists():
-                git_entries.append(
-                    {
-                        "name": "workflow_repository",
-                        "path": repo_path,
-                        "repository_url": self.params.get("repository_url"),
-                        "commit": git_manager.get_current_commit(repo_path),
-                    }
-                )
-
-            # Launcher repository (this codebase) - fall back to package version if installed from wheel
-            launcher_root = git_manager.find_repo_root(Path(__file__).resolve())
-            if launcher_root and Path(launcher_root, ".git").exists():
-                git_entries.append(
-                    {
-                        "name": "openscope-experimental-launcher",
-                        "path": launcher_root,
-                        "commit": git_manager.get_current_commit(launcher_root),
-                    }
-                )
-            else:
-                git_entries.append(
-                    {
-                        "name": "openscope-experimental-launcher",
-                        "commit": None,
-                        "package_version": importlib_metadata.version("openscope-experimental-launcher"),
-                        "source": "pip-installed (no .git)",
-                    }
-                )
+            documents = [
+                (input_params_file, self.original_input_params),
+                (processed_params_file, self.params),
+                (cmdline_file, cmdline_info),
+            ]
+
+            # 4. Git commit hashes for provenance (best effort; never blocks the other files)
+            git_file = None
+            try:
+                git_entries = self._collect_git_revisions()
+                if git_entries:
+                    git_file = os.path.join(metadata_dir, "git_revisions.json")
+                    documents.append((git_file, git_entries))
+            except Exception as e:
+                logging.warning(f"Failed to collect git revisions: {e}")
 
-            git_entries = [e for e in git_entries if e.get("commit") or e.get("package_version")]
-            if git_entries:
-                git_file = os.path.join(metadata_dir, "git_revisions.json")
-                with open(git_file, "w") as f:
-                    json.dump(git_entries, f, indent=2)
+            _write_json_documents(documents)
+            logging.info(f"Saved original input parameters to: {input_params_file}")
+            logging.info(f"Saved processed parameters to: {processed_params_file}")
+            logging.info(f"Saved command line info to: {cmdline_file}")
+            if git_file:
                 logging.info("Recorded git revisions: %s", git_file)
             logging.info(f"Launcher metadata saved to: {metadata_dir}")
             
         except Exception as e:
             logging.error(f"Failed to save experiment metadata: {e}")
     
+    def _collect_git_revisions(self) -> list:
+        """Return git provenance entries for the workflow and launcher repositories."""
+        git_entries = []
+
+        # Workflow repository (if configured and is a git repo)
+        repo_path = self._get_repo_path()
+        if repo_path and Path(repo_path, ".git").exists():
+            git_entries.append(
+                {
+                    "name": "workflow_repository",
+                    "path": repo_path,
+                    "repository_url": self.params.get("repository_url"),
+                    "commit": git_manager.get_current_commit(repo_path),
+                }
+            )
+
+        # Launcher repository (this codebase) - fall back to package version if installed from wheel
+        launcher_root = git_manager.find_repo_root(Path(__file__).resolve())
+        if launcher_root and Path(launcher_root, ".git").exists():
+            git_entries.append(
+                {
+                    "name": "openscope-experimental-launcher",
+                    "path": launcher_root,
+                    "commit": git_manager.get_current_commit(launcher_root),
+                }
+            )
+        else:
+            git_entries.append(
+                {
+                    "name": "openscope-experimental-launcher",
+                    "commit": None,
+                    "package_version": importlib_metadata.version("openscope-experimental-launcher"),
+                    "source": "pip-installed (no .git)",
+                }
+            )
+
+        return [e for e in git_entries if e.get("commit") or e.get("package_version")]
+
     def setup_continuous_logging(self, output_directory: str, centralized_log_dir: Optional[str] = None):
         """
         Set up continuous logging to output directory and optionally centralized location.
@@ -635,10 +885,7 @@ class BaseLauncher:
             log_filename = "launcher.log"
             
             # Set up logging format
-            log_format = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
+            log_format = _FILE_LOG_FORMATTER
             
             # Get root logger
             root_logger = logging.getLogger()
@@ -1029,13 +1276,9 @@ class BaseLauncher:
             logging.warning(f"Some {stage_name.lower()} steps failed. See logs.")
 
         # Persist abort intent for orchestration layer (e.g., abort before acquisition start)
-        if not hasattr(self, "_stage_abort"):
-            self._stage_abort = {}
         self._stage_abort[pipeline_key] = bool(abort_stage)
 
         # Persist failures for downstream actions (e.g., GitHub issue reporting)
-        if not hasattr(self, "_stage_failures"):
-            self._stage_failures = {}
         self._stage_failures[pipeline_key] = failed_steps
 
         self.params.update(params)
@@ -1073,23 +1316,29 @@ class BaseLauncher:
         If called multiple times, subsequent calls are ignored. Acquisition PID can be set
         later via `set_resource_logging_pid`.
         """
-        if hasattr(self, '_resource_log_thread') and getattr(self, '_resource_log_thread'):
+        if self._resource_log_thread:
             return  # Already running; do not restart
+        try:
+            interval = float(self.params.get("resource_log_interval", 5))
+        except (TypeError, ValueError):
+            interval = 5
+        if interval <= 0:
+            logging.info("Resource logging disabled (resource_log_interval <= 0)")
+            return
         launcher_metadata_dir = os.path.join(session_folder, "launcher_metadata")
         os.makedirs(launcher_metadata_dir, exist_ok=True)
         self._resource_log_file = os.path.join(launcher_metadata_dir, "resource_usage.json")
         self._resource_log_stop = threading.Event()
-        if not hasattr(self, '_resource_log_data'):
-            self._resource_log_data = []
-        self._resource_log_interval = self.params.get("resource_log_interval", 5)
+        self._resource_log_interval = interval
         self._resource_logging_acq_pid = acquisition_pid
         session_path = Path(session_folder)
         def log_loop():
-            import psutil, datetime, json, time
             launcher_proc = psutil.Process(os.getpid())
             acq_proc = None
             last_disk_io = psutil.disk_io_counters(perdisk=True)
             last_io_time = time.monotonic()
+            # True once the file on disk holds every sample so far as a JSON array
+            log_file_valid = False
             while not self._resource_log_stop.is_set():
                 # Attempt to resolve acquisition process if we have a PID and not yet a handle
                 if self._resource_logging_acq_pid and acq_proc is None:
@@ -1177,10 +1426,19 @@ class BaseLauncher:
                     entry["acquisition"] = None
                 self._resource_log_data.append(entry)
                 try:
-                    with open(self._resource_log_file, "w") as f:
-                        json.dump(self._resource_log_data, f, indent=2)
+                    if log_file_valid:
+                        # Overwrite the closing bracket instead of re-serializing every sample.
+                        with open(self._resource_log_file, "r+b") as f:
+                            f.seek(-len(_JSON_ARRAY_END), os.SEEK_END)
+                            f.write(b",\n" + _resource_sample_json(entry) + _JSON_ARRAY_END)
+                    else:
+                        with open(self._resource_log_file, "wb") as f:
+                            f.write(b"[\n" + b",\n".join(
+                                _resource_sample_json(e) for e in self._resource_log_data
+                            ) + _JSON_ARRAY_END)
+                        log_file_valid = True
                 except Exception:
-                    pass
+                    log_file_valid = False
                 time.sleep(self._resource_log_interval)
         self._resource_log_thread = threading.Thread(target=log_loop, daemon=True)
         self._resource_log_thread.start()
@@ -1190,9 +1448,9 @@ class BaseLauncher:
         self._resource_logging_acq_pid = acquisition_pid
 
     def _stop_resource_logging(self):
-        if hasattr(self, '_resource_log_stop'):
+        if self._resource_log_stop is not None:
             self._resource_log_stop.set()
-        if hasattr(self, '_resource_log_thread') and self._resource_log_thread:
+        if self._resource_log_thread:
             self._resource_log_thread.join(timeout=2)
 
     def run(self) -> bool:
@@ -1211,8 +1469,9 @@ class BaseLauncher:
         Returns:
             True if successful, False otherwise
         """
-        signal.signal(signal.SIGINT, self.signal_handler)
+        self._install_sigint_handler()
         self._sigint_received = False
+        self._stop_event.clear()
 
         try:
             self.start_time = datetime.datetime.now()
@@ -1260,16 +1519,13 @@ class BaseLauncher:
                         param_file=getattr(self, "original_param_file", None),
                         stage_kind="pre_acquisition",
                         stage_name="Pre-acquisition",
-                        failed_steps=(getattr(self, "_stage_failures", {}) or {}).get(
-                            "pre_acquisition_pipeline", []
-                        )
-                        or [],
+                        failed_steps=self._stage_failures.get("pre_acquisition_pipeline") or [],
                         output_directory=self.output_session_folder,
                     )
                 except Exception:
                     pass
 
-            if (getattr(self, "_stage_abort", {}) or {}).get("pre_acquisition_pipeline"):
+            if self._stage_abort.get("pre_acquisition_pipeline"):
                 logging.error("Pre-acquisition requested abort; not starting experiment.")
                 return False
 
@@ -1292,7 +1548,10 @@ class BaseLauncher:
                 logging.error(f"{self._get_launcher_type_name()} experiment failed")
                 return False
 
-            # Save end state for post-acquisition tools
+            # Save end state for post-acquisition tools. This must complete before the
+            # post-acquisition pipeline starts (session_creator and the enhancers read
+            # end_state.json), and pipeline steps run in order because later steps
+            # consume earlier outputs, so neither is run concurrently.
             self.save_end_state(self.output_session_folder)
 
             # Run post-acquisition steps
@@ -1312,10 +1571,7 @@ class BaseLauncher:
                         param_file=getattr(self, "original_param_file", None),
                         stage_kind="post_acquisition",
                         stage_name="Post-acquisition",
-                        failed_steps=(getattr(self, "_stage_failures", {}) or {}).get(
-                            "post_acquisition_pipeline", []
-                        )
-                        or [],
+                        failed_steps=self._stage_failures.get("post_acquisition_pipeline") or [],
                         output_directory=self.output_session_folder,
                     )
                 except Exception:
@@ -1338,8 +1594,8 @@ class BaseLauncher:
                         session_uuid=getattr(self, "session_uuid", "") or "",
                         param_file=getattr(self, "original_param_file", None),
                         exc=e,
-                        stderr_lines=getattr(self, "stderr_data", []) or [],
-                        stdout_lines=getattr(self, "stdout_data", []) or [],
+                        stderr_lines=self.stderr_data,
+                        stdout_lines=self.stdout_data,
                         output_directory=self.output_session_folder,
                     )
                 except Exception:
@@ -1351,6 +1607,8 @@ class BaseLauncher:
         finally:
             self._stop_resource_logging()
             self.stop()
+            # Ctrl+C only routes to this launcher while it is running
+            self._restore_sigint_handler()
 
     def start_experiment(self) -> bool:
         """
@@ -1363,10 +1621,6 @@ class BaseLauncher:
         """
         logging.info(f"Subject ID: {self.subject_id}, User ID: {self.user_id}, Session UUID: {self.session_uuid}, Rig ID: {self.rig_config['rig_id']}")
         
-        # Store current memory usage for monitoring
-        vmem = psutil.virtual_memory()
-        self._percent_used = vmem.percent
-        
         try:
             # Create the process using interface-specific logic
             self.process = self.create_process()
@@ -1438,22 +1692,35 @@ class BaseLauncher:
         else:
             console_level = int(log_level)
 
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(console_level)
-        console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-
-        # Force configuration because earlier import-time warnings can implicitly
-        # configure logging before we get here.
-        logging.basicConfig(level=logging.DEBUG, handlers=[console_handler], force=True)
+        root_logger = logging.getLogger()
+        handlers = root_logger.handlers
+        if len(handlers) == 1 and getattr(handlers[0], "_osl_console", False):
+            # Already configured by an earlier call in this process; only the level can differ.
+            handlers[0].setLevel(console_level)
+            root_logger.setLevel(logging.DEBUG)
+        else:
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(console_level)
+            console_handler.setFormatter(_CONSOLE_LOG_FORMATTER)
+            console_handler._osl_console = True
+
+            # Force configuration because earlier import-time warnings can implicitly
+            # configure logging before we get here.
+            logging.basicConfig(level=logging.DEBUG, handlers=[console_handler], force=True)
         
         try:
-            # Validate parameter file
-            if param_file and not os.path.exists(param_file):
-                logging.error(f"Parameter file not found: {param_file}")
-                return False
-            
-            # Create launcher instance with parameter file
-            launcher = cls(param_file=param_file)
+            # Create launcher instance with parameter file; a missing file surfaces
+            # here when it is opened, so it is not stat'ed separately first.
+            try:
+                launcher = cls(param_file=param_file)
+            except FileNotFoundError as e:
+                # Compare absolute paths: Path() normalizes e.g. "./params.json" before opening
+                if param_file and e.filename is not None and (
+                    os.path.abspath(os.fspath(e.filename)) == os.path.abspath(os.fspath(param_file))
+                ):
+                    logging.error(f"Parameter file not found: {param_file}")
+                    return False
+                raise
             launcher._console_log_level = console_level
             
             # Run the launcher
@@ -1475,63 +1742,192 @@ class BaseLauncher:
         except Exception as e:
             logging.error(f"Unexpected error: {e}")
             return False
+
+    @classmethod
+    def run_batch(cls, param_files, *, max_workers=None, log_level=None) -> list:
+        """
+        Run several parameter files, each in its own worker process.
+
+        Intended for offline replays/validation. Each worker runs a complete
+        launcher (and its acquisition subprocess), so ``max_workers`` is capped at
+        the CPU count. Worker processes run non-interactively (every prompt takes
+        its default); with a single worker the files run in this process instead.
+
+        Args:
+            param_files: Paths to JSON parameter files
+            max_workers: Number of worker processes (default: CPU count)
+            log_level: Console log level passed to run_from_params
+
+        Returns:
+            List of run_from_params results, in the order of ``param_files``
+        """
+        param_files = list(param_files)
+        if not param_files:
+            return []
+        cpu_count = os.cpu_count() or 1
+        if max_workers is None:
+            max_workers = cpu_count
+        elif max_workers > cpu_count:
+            logging.warning(
+                f"run_batch: max_workers={max_workers} exceeds the CPU count; using {cpu_count}"
+            )
+            max_workers = cpu_count
+        max_workers = max(1, min(max_workers, len(param_files)))
+
+        run = functools.partial(cls.run_from_params, log_level=log_level)
+        if max_workers == 1:
+            return [run(param_file) for param_file in param_files]
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_batch_worker
+        ) as executor:
+            return list(executor.map(run, param_files))
     
+    def _new_output_buffer(self) -> collections.deque:
+        """Return an empty buffer for captured process output.
+
+        Only the most recent ``output_tail_lines`` lines (default 5000) are kept so
+        long sessions do not accumulate every line in memory; every line is still
+        written to the launcher log as it arrives. A value <= 0 keeps all lines.
+        """
+        params = getattr(self, "params", None) or {}
+        try:
+            max_lines = int(params.get("output_tail_lines", 5000))
+        except (TypeError, ValueError):
+            max_lines = 5000
+        return collections.deque(maxlen=max_lines if max_lines > 0 else None)
+
     def _start_output_readers(self):
         """Start threads to read stdout and stderr in real-time."""
-        self.stdout_data = []
-        self.stderr_data = []
+        self.stdout_data = self._new_output_buffer()
+        self.stderr_data = self._new_output_buffer()
         
-        def stdout_reader():
-            if not self.process or not getattr(self.process, 'stdout', None):
-                return
-            if hasattr(self.process.stdout, '_mock_name'):
-                return
-            try:
-                for line in iter(self.process.stdout.readline, b''):
-                    if not line:
-                        break
-                    line_str = line.decode('utf-8').rstrip() if isinstance(line, bytes) else line.rstrip()
-                    if line_str:
-                        self.stdout_data.append(line_str)
-                        logging.info(f"{self._get_launcher_type_name()} output: {line_str}")
-            except Exception as e:
-                logging.debug(f"stdout reader error: {e}")
-            finally:
+        launcher_name = self._get_launcher_type_name()
+
+        def make_reader(stream, buffer, log, label):
+            # Everything looked up per line is bound once here; the pipe is iterated
+            # directly rather than through iter(readline, sentinel).
+            def reader():
+                pipe = getattr(self.process, stream, None) if self.process else None
+                if not pipe or _is_mock(pipe):
+                    return
+                append = buffer.append
+                on_line = self._on_output_line
+                is_stderr = stream == "stderr"
                 try:
-                    self.process.stdout.close()
-                except Exception:
-                    pass
+                    for line in pipe:
+                        line_str = line.decode(_OUTPUT_ENCODING, errors='replace').rstrip() if isinstance(line, bytes) else line.rstrip()
+                        if line_str:
+                            append(line_str)
+                            log(f"{launcher_name} {label}: {line_str}")
+                            if is_stderr and self._first_stderr_ts is None:
+                                self._first_stderr_ts = time.monotonic()
+                            on_line(stream, line_str)
+                except Exception as e:
+                    logging.debug(f"{stream} reader error: {e}")
+                finally:
+                    try:
+                        pipe.close()
+                    except Exception:
+                        pass
+            return reader
 
-        def stderr_reader():
-            if not self.process or not getattr(self.process, 'stderr', None):
-                return
-            if hasattr(self.process.stderr, '_mock_name'):
-                return
+        stdout_reader = make_reader("stdout", self.stdout_data, logging.info, "output")
+        stderr_reader = make_reader("stderr", self.stderr_data, logging.error, "error")
+
+        readers = (stdout_reader, stderr_reader)
+        with self._readers_lock:
+            self._readers_remaining = len(readers)
+            self._output_drained.clear()
+
+        def run_reader(reader):
             try:
-                for line in iter(self.process.stderr.readline, b''):
-                    if not line:
-                        break
-                    line_str = line.decode('utf-8').rstrip() if isinstance(line, bytes) else line.rstrip()
-                    if line_str:
-                        self.stderr_data.append(line_str)
-                        logging.error(f"{self._get_launcher_type_name()} error: {line_str}")
-                        if not hasattr(self, '_first_stderr_ts'):
-                            self._first_stderr_ts = time.time()
-            except Exception as e:
-                logging.debug(f"stderr reader error: {e}")
+                reader()
             finally:
-                try:
-                    self.process.stderr.close()
-                except Exception:
-                    pass
+                with self._readers_lock:
+                    self._readers_remaining -= 1
+                    if self._readers_remaining <= 0:
+                        self._output_drained.set()
 
         self._output_threads = [
-            threading.Thread(target=stdout_reader, daemon=True),
-            threading.Thread(target=stderr_reader, daemon=True)
+            threading.Thread(target=run_reader, args=(reader,), daemon=True)
+            for reader in readers
         ]
         for t in self._output_threads:
             t.start()
 
+    def _on_output_line(self, stream: str, line: str) -> None:
+        """Hook called by the output readers for every captured line.
+
+        Subclasses may inspect the line as it arrives and set
+        ``self._failure_reason``; with ``acquisition_error_terminate`` enabled the
+        monitor then terminates the process. Runs on the reader thread.
+        """
+
+    def _wait_for_output_drain(self, timeout: float = 2.0) -> bool:
+        """Wait (once, bounded) for the output readers to reach EOF after the process exits.
+
+        Returns:
+            True if all buffered output was consumed, False if the timeout elapsed
+        """
+        drained = self._output_drained.wait(timeout)
+        if not drained:
+            logging.debug("Output readers still draining after %.1fs; continuing.", timeout)
+        self._output_threads = [t for t in self._output_threads if t.is_alive()]
+        return drained
+
+    def _set_output_logs(self, stdout_log: Optional[str], stderr_log: Optional[str]) -> None:
+        """Record files that will receive the child's output instead of pipes.
+
+        The current size of each file is remembered so that only output of the
+        upcoming process is considered when the files are appended to across retries.
+        """
+        self._output_log_paths = {}
+        self._output_log_offsets = {}
+        for stream, path in (("stdout", stdout_log), ("stderr", stderr_log)):
+            if not path:
+                continue
+            self._output_log_paths[stream] = path
+            try:
+                self._output_log_offsets[stream] = os.path.getsize(path)
+            except OSError:
+                self._output_log_offsets[stream] = 0
+
+    def _output_log_has_data(self, stream: str) -> bool:
+        """Return True if the redirected log for ``stream`` grew since the process started."""
+        path = self._output_log_paths.get(stream)
+        if not path:
+            return False
+        try:
+            return os.path.getsize(path) > self._output_log_offsets.get(stream, 0)
+        except OSError:
+            return False
+
+    def _has_process_output(self) -> bool:
+        """Return True once the child produced any stdout/stderr output."""
+        if self.stdout_data or self.stderr_data:
+            return True
+        return self._output_log_has_data("stdout") or self._output_log_has_data("stderr")
+
+    def _read_output_log_tail(self, stream: str, max_lines: int = 200, max_bytes: int = 256 * 1024) -> list:
+        """Return the last non-empty lines the current process wrote to a redirected log."""
+        path = self._output_log_paths.get(stream)
+        if not path:
+            return []
+        offset = self._output_log_offsets.get(stream, 0)
+        try:
+            with open(path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                start = max(offset, size - max_bytes)
+                f.seek(start)
+                if start > offset:
+                    f.readline()  # drop the partial first line
+                tail = collections.deque(f, maxlen=max_lines)
+        except OSError as e:
+            logging.debug(f"Could not read {stream} log {path}: {e}")
+            return []
+        lines = (raw.decode(_OUTPUT_ENCODING, errors="replace").rstrip() for raw in tail)
+        return [line for line in lines if line]
+
     # === Added generic lifecycle helpers (previously removed during refactor) ===
     def signal_handler(self, sig, frame):  # type: ignore[override]
         """Handle SIGINT (Ctrl+C) to stop experiment cleanly."""
@@ -1545,7 +1941,8 @@ class BaseLauncher:
 
     def stop(self):
         """Stop acquisition process (if running) and finalize logging."""
-        if hasattr(self, 'stop_time') and self.stop_time is None:
+        self._stop_event.set()
+        if self.stop_time is None:
             self.stop_time = datetime.datetime.now()
         proc = getattr(self, 'process', None)
         if proc is not None and getattr(proc, 'poll', lambda: None)() is None:
@@ -1564,7 +1961,7 @@ class BaseLauncher:
 
     def get_process_errors(self):
         """Return accumulated stderr lines as a list."""
-        return list(getattr(self, 'stderr_data', []))
+        return list(self.stderr_data)
 
     def _get_launcher_type_name(self) -> str:
         """Return a human-readable launcher type name."""
@@ -1584,17 +1981,20 @@ class BaseLauncher:
             except Exception:
                 grace = 0.0
         start_timeout = float(self.params.get('process_start_timeout_sec', 0) or 0)
-        start_deadline = time.time() + start_timeout if start_timeout > 0 else None
+        start_deadline = time.monotonic() + start_timeout if start_timeout > 0 else None
+        exit_waiter = None
         try:
             if not fail_fast and not start_deadline:
                 proc.wait()
+                self._wait_for_output_drain()
                 return
-            # Polling loop with 0.5s interval
+            # Polling loop with 0.5s interval; wakes early when the process exits.
+            exit_waiter = _open_exit_waiter(proc)
             while True:
                 rc = proc.poll()
                 if rc is not None:
                     break
-                if start_deadline and time.time() > start_deadline and not (self.stdout_data or self.stderr_data):
+                if start_deadline and time.monotonic() > start_deadline and not self._has_process_output():
                     logging.error("Process start timeout exceeded; terminating.")
                     try:
                         proc.terminate(); proc.wait(timeout=5)
@@ -1603,8 +2003,22 @@ class BaseLauncher:
                         try: proc.kill()
                         except Exception: pass
                     break
-                if fail_fast and hasattr(self, '_first_stderr_ts'):
-                    elapsed = time.time() - getattr(self, '_first_stderr_ts', 0)
+                if fail_fast and self._failure_reason:
+                    logging.error(f"Fail-fast termination: {self._failure_reason}.")
+                    try:
+                        proc.terminate()
+                        proc.wait(timeout=5)
+                    except subprocess.TimeoutExpired:
+                        logging.warning("Process did not exit; killing.")
+                        try:
+                            proc.kill()
+                        except Exception:
+                            pass
+                    break
+                if fail_fast and self._first_stderr_ts is None and self._output_log_has_data("stderr"):
+                    self._first_stderr_ts = time.monotonic()
+                if fail_fast and self._first_stderr_ts is not None:
+                    elapsed = time.monotonic() - self._first_stderr_ts
                     if elapsed >= grace:
                         logging.error(f"Fail-fast termination after stderr error (grace {grace}s).")
                         try:
@@ -1617,9 +2031,12 @@ class BaseLauncher:
                             except Exception:
                                 pass
                         break
-                time.sleep(0.5)
+                _wait_for_exit(proc, 0.5, exit_waiter)
+            self._wait_for_output_drain()
         except Exception as e:
             logging.error(f"Monitoring error: {e}")
+        finally:
+            _close_exit_waiter(exit_waiter)
 
     def save_end_state(self, output_directory: Optional[str]):
         """Persist final launcher state for downstream post-acquisition tools."""
@@ -1649,8 +2066,7 @@ class BaseLauncher:
                 "rig_config": rig_config,
                 "experiment_data": experiment_data,
             }
-            with open(end_state_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            json_utils.dump_file(end_state_path, data)
             logging.info(f"Saved end_state to {end_state_path}")
             return True
         except Exception as e:
@@ -1678,21 +2094,33 @@ class BaseLauncher:
                     return val
                 except Exception:
                     return repr(val)
-            launcher_state = {k: _serialize(v) for k, v in self.__dict__.items() if not k.startswith('_')}
+            launcher_state = {
+                k: _serialize(v) for k, v in self.__dict__.items()
+                if not k.startswith('_') and k not in ('stdout_data', 'stderr_data')
+            }
+            # Captured output goes to its own files; the JSON only records where and how much.
+            for stream in ('stdout', 'stderr'):
+                lines = list(getattr(self, f'{stream}_data'))
+                output_file = None
+                if lines:
+                    output_file = f"debug_{stream}.log"
+                    with open(os.path.join(md_dir, output_file), 'w', encoding='utf-8') as f:
+                        f.write('\n'.join(lines) + '\n')
+                launcher_state[f'{stream}_data'] = {"file": output_file, "lines": len(lines)}
+            crash_time = datetime.datetime.now().isoformat()
             info = {
                 "exception": repr(exc),
                 "traceback": traceback.format_exc(),
-                "timestamp": datetime.datetime.now().isoformat(),
+                "timestamp": crash_time,
                 "session_uuid": self.session_uuid,
                 "crash_info": {
                     "exception_type": exc.__class__.__name__,
                     "message": str(exc),
-                    "crash_time": datetime.datetime.now().isoformat()  # added for test expectations
+                    "crash_time": crash_time  # added for test expectations
                 },
                 "launcher_state": launcher_state,
             }
-            with open(debug_path, 'w') as f:
-                json.dump(info, f, indent=2)
+            json_utils.dump_file(debug_path, info)
             logging.info(f"Saved debug_state to {debug_path}")
             return True
         except Exception as e:
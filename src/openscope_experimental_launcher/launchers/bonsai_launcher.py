@@ -8,9 +8,11 @@ Windows-specific optimizations.
 import os
 import logging
 import subprocess
-import time
 import re
-from typing import Dict, Optional
+import itertools
+import concurrent.futures
+import threading
+from typing import Dict, List, Optional, Pattern, Tuple
 
 # Import Windows-specific modules for process management
 try:
@@ -24,7 +26,14 @@ except ImportError:
 
 from .base_launcher import BaseLauncher
 from ..interfaces import bonsai_interface
-from ..utils import git_manager
+from ..utils import param_utils
+
+# Process-wide job object shared by all BonsaiLauncher instances (see _setup_windows_job)
+_SHARED_JOB = None
+_SHARED_JOB_LOCK = threading.Lock()
+
+# How long to wait for Bonsai to exit when monitoring stopped before it did
+_POST_MONITOR_EXIT_TIMEOUT_SEC = 10.0
 
 
 class BonsaiLauncher(BaseLauncher):
@@ -42,6 +51,14 @@ class BonsaiLauncher(BaseLauncher):
             rig_config_path: Optional override path to rig config file.
         """
         super().__init__(param_file, rig_config_path)
+
+        # Cached results of _resolve_bonsai_paths/_get_retry_patterns, keyed on the inputs they depend on
+        self._resolved_bonsai_paths: Optional[Tuple[tuple, Dict[str, str]]] = None
+        self._retry_patterns_cache: Optional[tuple] = None
+        # (combined regex, patterns) scanned against each output line of the current attempt
+        self._active_retry_patterns: Optional[Tuple[Optional[Pattern], List[Pattern]]] = None
+        # Resolved Bonsai paths for which setup_bonsai_environment last succeeded
+        self._bonsai_env_ready_for: Optional[tuple] = None
         
         # Windows job object for process management
         self.hJob = None
@@ -50,57 +67,141 @@ class BonsaiLauncher(BaseLauncher):
     # No additional Bonsai-specific error handling; BaseLauncher generic monitoring used.
     
     def _setup_windows_job(self):
-        """Set up Windows job object for process management."""
-        try:
-            self.hJob = win32job.CreateJobObject(None, "BonsaiJobObject")
-            extended_info = win32job.QueryInformationJobObject(
-                self.hJob, win32job.JobObjectExtendedLimitInformation
-            )
-            extended_info['BasicLimitInformation']['LimitFlags'] = (
-                win32job.JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE
-            )
-            win32job.SetInformationJobObject(
-                self.hJob, win32job.JobObjectExtendedLimitInformation, extended_info
-            )
-            logging.info("Windows job object created for process management")
-        except Exception as e:
-            logging.warning(f"Failed to create Windows job object: {e}")
-            self.hJob = None
+        """Set up Windows job object for process management.
+
+        The job is created and configured once per Python process and shared by
+        every launcher, so all Bonsai children belong to one kill-on-close group
+        that is torn down together when the launcher process exits.
+        """
+        global _SHARED_JOB
+        with _SHARED_JOB_LOCK:
+            if _SHARED_JOB is None:
+                try:
+                    job = win32job.CreateJobObject(None, "BonsaiJobObject")
+                    extended_info = win32job.QueryInformationJobObject(
+                        job, win32job.JobObjectExtendedLimitInformation
+                    )
+                    extended_info['BasicLimitInformation']['LimitFlags'] = (
+                        win32job.JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE
+                    )
+                    win32job.SetInformationJobObject(
+                        job, win32job.JobObjectExtendedLimitInformation, extended_info
+                    )
+                    _SHARED_JOB = job
+                    logging.info("Windows job object created for process management")
+                except Exception as e:
+                    logging.warning(f"Failed to create Windows job object: {e}")
+            self.hJob = _SHARED_JOB
     
     def _get_launcher_type_name(self) -> str:
         """Get the name of the launcher type for logging."""
         return "Bonsai"
     
+    # Parameters that should be resolved relative to the repository
+    _BONSAI_PATH_PARAMS = (
+        'bonsai_exe_path',
+        'bonsai_setup_script',
+        'bonsai_config_path',
+    )
+
     def _resolve_bonsai_paths(self) -> Dict[str, str]:
         """
         Resolve all Bonsai-related paths relative to the repository.
+
+        The result is cached on the instance and reused across retries for as
+        long as the path and repository parameters it was computed from are
+        unchanged.
         
         Returns:
             Dictionary with resolved absolute paths for Bonsai components
         """
-        repo_path = git_manager.get_repository_path(self.params)
+        repo_path = self._get_repo_path()
+        cache_key = (repo_path,) + tuple(self.params.get(name) for name in self._BONSAI_PATH_PARAMS)
+        if self._resolved_bonsai_paths and self._resolved_bonsai_paths[0] == cache_key:
+            return dict(self._resolved_bonsai_paths[1])
+
         resolved_params = {}
         
-        # List of path parameters that should be resolved relative to repo
-        path_params = [
-            'bonsai_exe_path',
-            'bonsai_setup_script', 
-            'bonsai_config_path'
-        ]
-        
-        for param_name in path_params:
+        for param_name in self._BONSAI_PATH_PARAMS:
             param_value = self.params.get(param_name)
             if param_value:
-                if os.path.isabs(param_value):
-                    # Already absolute path
-                    resolved_params[param_name] = param_value
-                elif repo_path:
-                    # Resolve relative to repository
-                    resolved_params[param_name] = os.path.join(repo_path, param_value)
-                else:
-                    # No repository path available, use as-is
-                    resolved_params[param_name] = param_value                    
-        return resolved_params
+                # Absolute paths and paths without a repository are used as-is
+                resolved_params[param_name] = self._resolve_repo_relative(param_value)
+
+        self._resolved_bonsai_paths = (cache_key, resolved_params)
+        return dict(resolved_params)
+
+    # Backreferences would be renumbered when patterns are joined into one regex
+    _BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+    def _get_retry_patterns(self) -> Tuple[Optional[Pattern], List[Pattern]]:
+        """Compile ``bonsai_retry_error_patterns`` once per distinct pattern list.
+
+        Returns:
+            Tuple of (combined alternation regex or None, individually compiled
+            patterns). The combined regex lets each line be scanned once; the
+            individual patterns identify which one matched. It is None when the
+            patterns cannot be joined without changing their meaning (inline
+            flags or backreferences).
+        """
+        patterns = self.params.get("bonsai_retry_error_patterns") or []
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        cache_key = tuple(str(pat) for pat in patterns)
+        if self._retry_patterns_cache and self._retry_patterns_cache[0] == cache_key:
+            return self._retry_patterns_cache[1]
+
+        compiled_patterns = []
+        for pat in cache_key:
+            try:
+                compiled_patterns.append(re.compile(pat))
+            except re.error:
+                logging.warning("Invalid regex in bonsai_retry_error_patterns: %r", pat)
+
+        combined = None
+        if compiled_patterns and all(
+            cre.flags == re.UNICODE and not self._BACKREFERENCE.search(cre.pattern)
+            for cre in compiled_patterns
+        ):
+            try:
+                combined = re.compile("|".join("(?:%s)" % cre.pattern for cre in compiled_patterns))
+            except re.error:
+                combined = None
+
+        result = (combined, compiled_patterns)
+        self._retry_patterns_cache = (cache_key, result)
+        return result
+
+    @staticmethod
+    def _match_retry_pattern(line, retry_regex: Optional[Pattern], compiled_patterns: List[Pattern]) -> Optional[str]:
+        """Return the first pattern in ``compiled_patterns`` that matches ``line``, if any."""
+        text = line if isinstance(line, str) else str(line)
+        if retry_regex is not None and not retry_regex.search(text):
+            return None
+        for cre in compiled_patterns:
+            if cre.search(text):
+                return cre.pattern
+        return None
+
+    @staticmethod
+    def _parse_max_retries(value) -> Optional[int]:
+        """Interpret ``bonsai_max_retries``: None, blank or negative means unlimited."""
+        if value is None:
+            return None
+        if not isinstance(value, int):
+            if isinstance(value, str) and not value.strip():
+                return None
+            value = int(value)
+        return value if value >= 0 else None
+
+    def _on_output_line(self, stream: str, line: str) -> None:
+        """Match retry error patterns as output arrives so the buffers need no rescan."""
+        active = self._active_retry_patterns
+        if active is None or self._failure_reason:
+            return
+        matched = self._match_retry_pattern(line, *active)
+        if matched:
+            self._failure_reason = f"log matched pattern {matched!r}"
 
     def _get_script_path(self) -> str:
         """Resolve and return absolute path to Bonsai workflow (.bonsai file).
@@ -111,12 +212,8 @@ class BonsaiLauncher(BaseLauncher):
         script_path = self.params.get('script_path')
         if not script_path:
             raise RuntimeError("Missing 'script_path' parameter for Bonsai workflow")
-        if os.path.isabs(script_path):
-            candidate = script_path
-        else:
-            repo_root = git_manager.get_repository_path(self.params)
-            candidate = os.path.join(repo_root, script_path) if repo_root else script_path
-        if not os.path.isfile(candidate):
+        candidate = self._resolve_repo_relative(script_path)
+        if not self._script_file_exists(candidate):
             raise RuntimeError(f"Bonsai workflow not found: {candidate}")
         logging.info(f"Using Bonsai workflow: {candidate}")
         return candidate
@@ -126,13 +223,25 @@ class BonsaiLauncher(BaseLauncher):
         if not (WINDOWS_MODULES_AVAILABLE and self.hJob and self.process):
             return
             
+        if self.process.poll() is not None:
+            # Nothing left to contain; assigning an exited process fails with "Access is denied".
+            logging.debug("Bonsai process exited before job assignment; skipping")
+            return
+
         try:
-            perms = win32con.PROCESS_TERMINATE | win32con.PROCESS_SET_QUOTA
-            hProcess = win32api.OpenProcess(perms, False, self.process.pid)
-            win32job.AssignProcessToJobObject(self.hJob, hProcess)
+            # Popen already holds a full-access handle from CreateProcess; reuse it
+            # rather than opening a second one by PID.
+            hProcess = getattr(self.process, "_handle", None)
+            if hProcess is None:
+                perms = win32con.PROCESS_TERMINATE | win32con.PROCESS_SET_QUOTA
+                hProcess = win32api.OpenProcess(perms, False, self.process.pid)
+            win32job.AssignProcessToJobObject(self.hJob, int(hProcess))
             logging.info(f"Bonsai process {self.process.pid} assigned to job object")
         except Exception as e:
-            logging.warning(f"Failed to assign process to job object: {e}")
+            if self.process.poll() is not None:
+                logging.debug(f"Bonsai process exited during job assignment: {e}")
+            else:
+                logging.warning(f"Failed to assign process to job object: {e}")
     
     def create_process(self) -> subprocess.Popen:
         """
@@ -148,21 +257,48 @@ class BonsaiLauncher(BaseLauncher):
         bonsai_params = self.params.copy()
         bonsai_params.update(resolved_paths)
         
-        # Setup Bonsai environment (including installation if needed)
-        if not bonsai_interface.setup_bonsai_environment(bonsai_params):
-            raise RuntimeError("Failed to setup Bonsai environment")
-          # Get workflow path
-        workflow_path = self._get_script_path()
+        # Setup Bonsai environment (including installation if needed). Retries reuse a
+        # successful setup as long as the resolved Bonsai paths are unchanged.
+        env_key = tuple(sorted(resolved_paths.items()))
+        workflow_path = None
+        if self._bonsai_env_ready_for != env_key:
+            if self.params.get('bonsai_parallel_setup'):
+                # Check the workflow path while the (possibly installing) setup runs.
+                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                    path_future = executor.submit(self._get_script_path)
+                    env_ok = bonsai_interface.setup_bonsai_environment(bonsai_params)
+                    path_error = path_future.exception()
+                if not env_ok:
+                    raise RuntimeError("Failed to setup Bonsai environment")
+                if path_error is not None:
+                    raise path_error
+                workflow_path = path_future.result()
+            elif not bonsai_interface.setup_bonsai_environment(bonsai_params):
+                raise RuntimeError("Failed to setup Bonsai environment")
+            self._bonsai_env_ready_for = env_key
+        # Get workflow path
+        if workflow_path is None:
+            workflow_path = self._get_script_path()
         
         # Construct arguments using BonsaiInterface
         workflow_args = bonsai_interface.construct_workflow_arguments(self.params)
+
+        # Optionally let the OS write Bonsai output straight to log files
+        stdout_log = stderr_log = None
+        if self.params.get('bonsai_stream_output_to_file') and self.output_session_folder:
+            metadata_dir = os.path.join(self.output_session_folder, "launcher_metadata")
+            stdout_log = os.path.join(metadata_dir, "bonsai_stdout.log")
+            stderr_log = os.path.join(metadata_dir, "bonsai_stderr.log")
+        self._set_output_logs(stdout_log, stderr_log)
         
         # Start workflow using BonsaiInterface
         process = bonsai_interface.start_workflow(
             workflow_path=workflow_path,
             bonsai_exe_path=bonsai_params.get('bonsai_exe_path'),
             arguments=workflow_args,
-            output_folder=self.output_session_folder
+            output_folder=self.output_session_folder,
+            stdout_log=stdout_log,
+            stderr_log=stderr_log,
         )
         
         # Assign process to Windows job object if available
@@ -184,48 +320,39 @@ class BonsaiLauncher(BaseLauncher):
                     If 0 -> no retries (fail immediately).
                 - bonsai_retry_delay_sec (float): delay between retries (default 0)
                 - bonsai_fail_on_stderr (bool): treat any stderr output as failure (default True)
-                - bonsai_retry_error_patterns (list[str]): regex patterns; if any match stdout/stderr, treat as failure
+                - bonsai_retry_error_patterns (list[str]): regex patterns; if any match stdout/stderr, treat as failure.
+                    Lines are matched as they are read; with acquisition_error_terminate enabled the
+                    first match also terminates Bonsai.
                 - bonsai_continue_on_failure (bool): legacy flag to proceed after a failure. Superseded by the
                     explicit operator prompt below.
                 - bonsai_failure_default (str): default action when prompting on failure. One of
                     "retry", "proceed", "abort". Defaults to "retry" when retries remain, otherwise "abort".
+                - bonsai_stream_output_to_file (bool): redirect Bonsai stdout/stderr to
+                    launcher_metadata/bonsai_stdout.log / bonsai_stderr.log instead of piping it
+                    through the launcher (default False). Failure checks then use the last
+                    200 lines of each log.
+                - bonsai_parallel_setup (bool): resolve the workflow path concurrently with
+                    Bonsai environment setup on the first attempt (default False).
                 """
 
         continue_on_failure = bool(self.params.get("bonsai_continue_on_failure", False))
 
-        max_retries_raw = self.params.get("bonsai_max_retries", None)
-        max_retries: Optional[int]
-        if max_retries_raw is None or str(max_retries_raw).strip() == "":
-            max_retries = None
-        else:
-            max_retries = int(max_retries_raw)
-            if max_retries < 0:
-                max_retries = None
+        max_retries = self._parse_max_retries(self.params.get("bonsai_max_retries", None))
 
         retry_delay = float(self.params.get("bonsai_retry_delay_sec", 0) or 0)
         # Default to fail on any stderr so operator is always prompted unless explicitly disabled.
         fail_on_stderr = bool(self.params.get("bonsai_fail_on_stderr", True))
-        patterns = self.params.get("bonsai_retry_error_patterns") or []
-        if isinstance(patterns, str):
-            patterns = [patterns]
-        compiled_patterns = []
-        for pat in patterns:
-            try:
-                compiled_patterns.append(re.compile(str(pat)))
-            except re.error:
-                logging.warning("Invalid regex in bonsai_retry_error_patterns: %r", pat)
+        retry_regex, compiled_patterns = self._get_retry_patterns()
 
         attempt = 1
         retries_used = 0
         while True:
-            # Reset per-attempt buffers so we don't show stale errors.
-            self.stdout_data = []
-            self.stderr_data = []
-            if hasattr(self, "_first_stderr_ts"):
-                try:
-                    delattr(self, "_first_stderr_ts")
-                except Exception:
-                    pass
+            # Reset per-attempt state so we don't show stale errors.
+            self.stdout_data.clear()
+            self.stderr_data.clear()
+            self._first_stderr_ts = None
+            self._failure_reason = None
+            self._active_retry_patterns = (retry_regex, compiled_patterns) if compiled_patterns else None
 
             logging.info(
                 "Starting Bonsai workflow attempt %d (retries used: %d)",
@@ -242,43 +369,60 @@ class BonsaiLauncher(BaseLauncher):
             logging.info("Bonsai PID: %s", getattr(self.process, "pid", "unknown"))
 
             self._monitor_process()
+            # _monitor_process normally returns once the process has exited, so poll()
+            # just reads the exit code from the Popen handle. If monitoring stopped early
+            # (e.g. a monitoring error), wait a bounded time, then terminate the attempt.
             try:
-                self.process.wait(timeout=0.1)
+                if self.process.poll() is None:
+                    try:
+                        self.process.wait(timeout=_POST_MONITOR_EXIT_TIMEOUT_SEC)
+                    except subprocess.TimeoutExpired:
+                        logging.warning("Bonsai still running after monitoring stopped; terminating")
+                        self.process.terminate()
+                        try:
+                            self.process.wait(timeout=5)
+                        except subprocess.TimeoutExpired:
+                            logging.warning("Process did not exit after terminate; killing")
+                            self.process.kill()
+                            self.process.wait(timeout=5)
             except Exception:
                 pass
 
+            if self._output_log_paths:
+                # Output went straight to disk; only the tail is needed for failure checks.
+                self.stdout_data = self._read_output_log_tail("stdout")
+                self.stderr_data = self._read_output_log_tail("stderr")
+
             rc = getattr(self.process, "returncode", None)
 
             failure_reason = None
             if rc not in (None, 0):
                 failure_reason = f"exit code {rc}"
-            elif fail_on_stderr and getattr(self, "stderr_data", None):
+            elif fail_on_stderr and self.stderr_data:
                 failure_reason = "stderr output detected"
-            elif compiled_patterns:
-                combined = (getattr(self, "stdout_data", []) or []) + (getattr(self, "stderr_data", []) or [])
-                for line in combined:
-                    for cre in compiled_patterns:
-                        if cre.search(str(line)):
-                            failure_reason = f"log matched pattern {cre.pattern!r}"
-                            break
-                    if failure_reason:
+            elif self._failure_reason:
+                # Set while streaming output (see _on_output_line)
+                failure_reason = self._failure_reason
+            elif compiled_patterns and self._output_log_paths:
+                # Output bypassed the readers; scan the log tails instead.
+                for line in itertools.chain(self.stdout_data, self.stderr_data):
+                    matched = self._match_retry_pattern(line, retry_regex, compiled_patterns)
+                    if matched:
+                        failure_reason = f"log matched pattern {matched!r}"
                         break
 
             if failure_reason is None:
                 return True
 
             remaining = None if max_retries is None else max(0, max_retries - retries_used)
-            logging.error(
-                "Bonsai workflow failed (%s). Remaining retries: %s",
-                failure_reason,
-                "unlimited" if remaining is None else str(remaining),
-            )
-
-            # Surface some context for the operator.
-            tail = (getattr(self, "stderr_data", []) or [])[-10:]
-            for line in tail:
-                if str(line).strip():
-                    logging.error("Bonsai stderr: %s", line)
+            # Surface some context for the operator, as a single multi-line record.
+            parts = [
+                "Bonsai workflow failed (%s). Remaining retries: %s"
+                % (failure_reason, "unlimited" if remaining is None else str(remaining))
+            ]
+            tail = itertools.islice(self.stderr_data, max(0, len(self.stderr_data) - 10), None)
+            parts.extend("Bonsai stderr: %s" % line for line in tail if str(line).strip())
+            logging.error("%s", "\n".join(parts))
 
             can_retry = (max_retries is None) or (retries_used < max_retries)
             default_action = str(
@@ -301,8 +445,6 @@ class BonsaiLauncher(BaseLauncher):
             prompt_str = " / ".join(prompt_options)
 
             try:
-                from openscope_experimental_launcher.utils import param_utils
-
                 raw = param_utils.get_user_input(
                     f"Bonsai workflow failed ({failure_reason}). {prompt_str}?",
                     default=default_action[0] if default_action else None,
@@ -328,8 +470,9 @@ class BonsaiLauncher(BaseLauncher):
                     logging.error("Retry selected but maximum retries have been reached.")
                     action = "abort"
                 else:
-                    if retry_delay > 0:
-                        time.sleep(retry_delay)
+                    if retry_delay > 0 and self._stop_event.wait(retry_delay):
+                        logging.info("Stop requested during retry delay; not retrying Bonsai.")
+                        return False
                     retries_used += 1
                     attempt += 1
                     continue
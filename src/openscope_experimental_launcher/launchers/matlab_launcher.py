@@ -58,9 +58,11 @@ class MatlabLauncher(BaseLauncher):
                 process_engine = getattr(self.process, "current_engine", None)
             if process_engine is not None:
                 self._matlab_engine = process_engine
+            request = self._matlab_request
             matlab_interface.cleanup_engine(
                 self._matlab_engine,
-                getattr(self, "process", None)
+                getattr(self, "process", None),
+                keep_alive=bool(request is not None and request.keep_engine_alive),
             )
         finally:
             self._matlab_engine = None
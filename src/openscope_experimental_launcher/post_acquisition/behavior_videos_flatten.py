@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import errno
 import logging
+import os
 import shutil
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, Optional
+from typing import AbstractSet, Any, Dict, List, Mapping, Optional, Set, Tuple
 
 from openscope_experimental_launcher.utils import manifest_utils, param_utils
 
@@ -12,6 +14,13 @@ LOG = logging.getLogger(__name__)
 
 _DEF_ROOT = "behavior-videos"
 
+# Files at least this large are copied in-kernel with copy_file_range where available.
+_FAST_COPY_MIN_SIZE = 64 * 1024 * 1024
+_FAST_COPY_CHUNK = 1 << 30
+
+# Moves/copies are I/O bound (often onto network storage), so a few run concurrently.
+_TRANSFER_WORKERS = 8
+
 
 def _load_params(param_source: Any, overrides: Optional[Mapping[str, Any]]) -> Dict[str, Any]:
     if isinstance(param_source, Mapping):
@@ -22,50 +31,114 @@ def _load_params(param_source: Any, overrides: Optional[Mapping[str, Any]]) -> D
     return param_utils.load_parameters(param_file=param_source, overrides=overrides)
 
 
-def _find_behavior_roots(session_dir: Path, root_name: str) -> List[Path]:
-    roots: List[Path] = []
-    for path in session_dir.rglob(root_name):
-        if path.is_dir():
-            roots.append(path)
-    return roots
-
+def _walk_session(
+    session_dir: Path, root_name: str, ext_set: Optional[AbstractSet[str]]
+) -> Tuple[List[Path], Dict[Path, List[Path]]]:
+    """Find behavior roots and the files under each in a single scandir pass.
 
-def _iter_nested_files(root: Path, exts: Optional[Iterable[str]]) -> List[Path]:
-    targets: List[Path] = []
-    ext_set = {e.lower() for e in exts} if exts else None
-    for path in root.rglob("*"):
-        if not path.is_file():
-            continue
-        if ext_set is not None and path.suffix.lower() not in ext_set:
+    A root nested inside another root is not reported separately; its files
+    belong to the outer root.
+    """
+    roots: List[Path] = []
+    files_by_root: Dict[Path, List[Path]] = {}
+    stack: List[Tuple[str, Optional[Path]]] = [(str(session_dir), None)]
+    while stack:
+        dir_path, root = stack.pop()
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
             continue
-        targets.append(path)
-    return targets
-
-
-def _next_available(dest: Path) -> Path:
-    if not dest.exists():
-        return dest
-    stem = dest.stem
-    suffix = dest.suffix
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    child_root = root
+                    if root is None and entry.name == root_name:
+                        child_root = Path(entry.path)
+                        roots.append(child_root)
+                        files_by_root[child_root] = []
+                    stack.append((entry.path, child_root))
+                elif root is not None and entry.is_file():
+                    if ext_set is None or os.path.splitext(entry.name)[1].lower() in ext_set:
+                        files_by_root[root].append(Path(entry.path))
+    return roots, files_by_root
+
+
+def _next_available(dest: Path, claimed: Dict[Path, Set[str]]) -> Path:
+    """Return ``dest`` or a ``_dupN`` variant not yet taken in its directory.
+
+    ``claimed`` maps each destination directory to the (normcase'd) names in it;
+    a directory is listed once, then probes are set lookups instead of stats.
+    """
     parent = dest.parent
+    names = claimed.get(parent)
+    if names is None:
+        try:
+            names = {os.path.normcase(name) for name in os.listdir(parent)}
+        except OSError:
+            names = set()
+        claimed[parent] = names
+    candidate = dest.name
     counter = 1
-    while True:
-        candidate = parent / f"{stem}_dup{counter}{suffix}"
-        if not candidate.exists():
-            return candidate
+    while os.path.normcase(candidate) in names:
+        candidate = f"{dest.stem}_dup{counter}{dest.suffix}"
         counter += 1
+    names.add(os.path.normcase(candidate))
+    return parent / candidate
 
 
-def _remove_empty_dirs(root: Path) -> None:
-    for path in sorted(root.rglob("*"), reverse=True):
-        if path.is_dir():
-            try:
-                next(path.iterdir())
-            except StopIteration:
+def _move(src: Path, dest: Path) -> None:
+    # A same-volume move is a single rename; only a cross-device move needs shutil's copy fallback.
+    try:
+        os.replace(src, dest)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dest))
+
+
+def _copy(src: Path, dest: Path) -> None:
+    # Large videos are copied kernel-side (no user-space buffer); anything else, or a
+    # filesystem that rejects copy_file_range before the first byte, goes through copy2.
+    if hasattr(os, "copy_file_range"):
+        size = os.stat(src).st_size
+        if size >= _FAST_COPY_MIN_SIZE:
+            with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+                in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+                copied = 0
                 try:
-                    path.rmdir()
-                except Exception:
-                    pass
+                    while True:
+                        sent = os.copy_file_range(in_fd, out_fd, _FAST_COPY_CHUNK)
+                        if not sent:
+                            break
+                        copied += sent
+                except OSError as exc:
+                    if copied or exc.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                        raise
+                    copied = -1
+            if copied >= 0:
+                shutil.copystat(src, dest)
+                return
+    shutil.copy2(src, dest)
+
+
+def _session_relative(path: str, session_prefix: str) -> str:
+    if not path.startswith(session_prefix):
+        raise ValueError(f"{path!r} is not inside the session folder {session_prefix!r}")
+    return path[len(session_prefix):]
+
+
+def _remove_empty_dirs(root: Path) -> None:
+    # Bottom-up walk: children are pruned before their parent is tried. dirnames is
+    # listed before that pruning, so a directory with no files is simply attempted
+    # and rmdir refuses it if anything is left.
+    top = str(root)
+    for dirpath, _dirnames, filenames in os.walk(top, topdown=False):
+        if filenames or dirpath == top:
+            continue
+        try:
+            os.rmdir(dirpath)
+        except OSError:
+            pass
 
 
 def run_post_acquisition(param_file: Any = None, overrides: Optional[Mapping[str, Any]] = None) -> int:
@@ -77,7 +150,9 @@ def run_post_acquisition(param_file: Any = None, overrides: Optional[Mapping[str
             return 1
         session_dir = Path(str(session_dir_param)).expanduser().resolve()
         root_name = params.get("behavior_videos_root", _DEF_ROOT)
-        behavior_roots = _find_behavior_roots(session_dir, root_name)
+        exts_param = params.get("behavior_videos_extensions")
+        ext_set = frozenset(e.lower() for e in exts_param) if exts_param else None
+        behavior_roots, files_by_root = _walk_session(session_dir, root_name, ext_set)
         if not behavior_roots:
             LOG.info("No '%s' folders found under %s", root_name, session_dir)
             return 0
@@ -92,29 +167,45 @@ def run_post_acquisition(param_file: Any = None, overrides: Optional[Mapping[str
             dest_base = session_dir
         dest_base.mkdir(parents=True, exist_ok=True)
 
-        exts_param = params.get("behavior_videos_extensions")
-        exts = None
-        if exts_param:
-            exts = list(exts_param)
         copy_only = bool(params.get("behavior_videos_copy_only", False))
         remove_empty = bool(params.get("behavior_videos_prune_empty", True))
 
         flattened: List[str] = []
+        claimed: Dict[Path, Set[str]] = {}
+        made_dirs: Set[Path] = set()
+        session_prefix = os.path.join(str(session_dir), "")
         for behavior_root in behavior_roots:
-            targets = _iter_nested_files(behavior_root, exts)
+            targets = files_by_root[behavior_root]
             if not targets:
                 continue
 
+            # Walked paths are built by string join from these roots, so prefixes can be sliced off.
+            root_len = len(os.path.join(str(behavior_root), ""))
+            # Destinations are claimed serially so workers never race on a name.
+            jobs = []
             for src in targets:
-                rel = src.relative_to(behavior_root)
-                dest = _next_available(dest_base / rel)
-                dest.parent.mkdir(parents=True, exist_ok=True)
-                if copy_only:
-                    shutil.copy2(src, dest)
-                else:
-                    shutil.move(src, dest)
-                flattened.append(dest.relative_to(session_dir).as_posix())
-                LOG.info("Flattened %s -> %s", src.relative_to(session_dir), dest.relative_to(session_dir))
+                dest = _next_available(dest_base / str(src)[root_len:], claimed)
+                if dest.parent not in made_dirs:
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    made_dirs.add(dest.parent)
+                jobs.append((src, dest))
+
+            transfer = _copy if copy_only else _move
+            workers = min(_TRANSFER_WORKERS, len(jobs))
+            if workers > 1:
+                import concurrent.futures  # only needed when there is more than one file
+
+                with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                    for _ in executor.map(lambda job: transfer(*job), jobs):
+                        pass
+            else:
+                for src, dest in jobs:
+                    transfer(src, dest)
+
+            for src, dest in jobs:
+                dest_rel = _session_relative(str(dest), session_prefix)
+                flattened.append(dest_rel.replace(os.sep, "/"))
+                LOG.info("Flattened %s -> %s", str(src)[len(session_prefix):], dest_rel)
 
             if remove_empty and behavior_root != dest_base:
                 _remove_empty_dirs(behavior_root)
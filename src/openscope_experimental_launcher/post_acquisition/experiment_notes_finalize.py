@@ -2,17 +2,26 @@
 from __future__ import annotations
 
 import logging
+import os
 import subprocess
 import sys
+import time
 from pathlib import Path
 from typing import Any, Mapping, Optional
 
+import psutil
+
 from openscope_experimental_launcher.utils import param_utils
 from openscope_experimental_launcher.utils import manifest_utils
 
 LOG = logging.getLogger(__name__)
 
 _DEFAULT_NOTES_FILENAME = "experiment_notes.txt"
+_EDITOR_PID_MARKER = "# EditorPID:"
+_YES_RESPONSES = frozenset({"yes", "y", ""})
+_NO_RESPONSES = frozenset({"no", "n"})
+_NO_RESPONSE_RETRY_DELAY = 0.05
+_PREVIEW_DIVIDER = "-" * 60
 _DEFAULT_CONFIRM_PROMPT = (
     "Confirm experiment notes have been saved and the editor is closed. Type 'yes' to continue."
 )
@@ -34,62 +43,99 @@ def _resolve_notes_path(params: Mapping[str, Any]) -> Path:
         base = params.get("output_session_folder")
         if not base:
             raise ValueError("output_session_folder is required to resolve experiment notes path")
-        path = (Path(str(base)).expanduser() / path).resolve()
+        # abspath is string-only; resolve() would query the filesystem for every component.
+        path = Path(os.path.abspath(os.path.join(os.path.expanduser(str(base)), path)))
     path.parent.mkdir(parents=True, exist_ok=True)
     return path
 
 
+def _create_if_missing(path: Path) -> bool:
+    """Create ``path`` empty unless it exists; return True if it was created.
+
+    A single exclusive open both tests and creates, with no window between the two.
+    """
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    except FileExistsError:
+        return False
+    os.close(fd)
+    return True
+
+
 def _extract_editor_pid(notes_path: Path, encoding: str) -> Optional[int]:
     try:
         text = notes_path.read_text(encoding=encoding)
     except Exception:  # noqa: BLE001
         return None
-    for line in text.splitlines():
-        if line.startswith("# EditorPID:"):
-            try:
-                return int(line.split(":", 1)[1].strip())
-            except Exception:  # noqa: BLE001
-                return None
-    return None
+    return _extract_editor_pid_from_text(text)
+
+
+def _extract_editor_pid_from_text(text: str) -> Optional[int]:
+    # Locate the marker at a line start with find() rather than splitting the whole file into lines.
+    idx = text.find(_EDITOR_PID_MARKER)
+    while idx > 0 and text[idx - 1] not in "\r\n":
+        idx = text.find(_EDITOR_PID_MARKER, idx + 1)
+    if idx == -1:
+        return None
+    start = idx + len(_EDITOR_PID_MARKER)
+    end = text.find("\n", start)
+    try:
+        return int(text[start:end if end != -1 else None].strip())
+    except ValueError:
+        return None
 
 
-def _show_preview(notes_path: Path, encoding: str, preview_limit: Optional[int]) -> None:
+def _show_preview(notes_path: Path, encoding: str, preview_limit: Optional[int]) -> Optional[str]:
+    """Log a preview of the notes and return the full text (None if unread or unreadable)."""
+    if not LOG.isEnabledFor(logging.INFO):
+        # Nothing would be shown; skip reading the file (the PID lookup reads it if needed).
+        return None
     try:
         raw_content = notes_path.read_text(encoding=encoding)
     except Exception as exc:  # noqa: BLE001
         LOG.warning("Unable to read experiment notes for preview: %s", exc)
-        return
+        return None
     content = raw_content
     truncated = False
     if isinstance(preview_limit, int) and preview_limit > 0 and len(content) > preview_limit:
         content = content[:preview_limit]
         truncated = True
-    divider = "-" * 60
-    display = content if content else "[File is empty]"
-    LOG.info("%s\nExperiment notes preview (%s):\n%s\n%s", divider, notes_path, display, divider)
+    LOG.info("%s\nExperiment notes preview (%s):", _PREVIEW_DIVIDER, notes_path)
+    # Logged with no args so the (possibly large) notes text is not %-formatted into a copy per handler.
+    LOG.info(content if content else "[File is empty]")
+    LOG.info(_PREVIEW_DIVIDER)
     if truncated:
         LOG.info(
             "Preview truncated to first %s characters; adjust experiment_notes_preview_limit to see more.",
             preview_limit,
         )
+    return raw_content
 
 
 def _confirm_yes(prompt: str, prompt_func, *, allow_no: bool, max_attempts: Optional[int]) -> bool:
     attempts = 0
+    no_response = 0
     limit = max_attempts if max_attempts is not None else 3
     while True:
         resp = prompt_func(prompt, "")
         if resp is None:
+            # A prompt backend that keeps returning None must not spin (or livelock) forever.
+            no_response += 1
+            if no_response >= limit:
+                LOG.warning("No confirmation response after %s attempt(s); aborting.", no_response)
+                return False
+            time.sleep(_NO_RESPONSE_RETRY_DELAY)
             continue
-        text = str(resp).strip().lower()
-        if text in {"yes", "y", ""}:
+        no_response = 0
+        text = (resp if isinstance(resp, str) else str(resp)).strip().lower()
+        if text in _YES_RESPONSES:
             return True
-        if text in {"no", "n"}:
+        if text in _NO_RESPONSES:
             if allow_no:
                 LOG.info("Confirmation declined; exiting experiment notes finalization.")
                 return False
             attempts += 1
-            if limit is not None and attempts >= limit:
+            if attempts >= limit:
                 LOG.error("Confirmation not received after %s attempt(s); aborting.", attempts)
                 return False
             LOG.info("Confirmation declined; please review notes and confirm again.")
@@ -101,7 +147,20 @@ def _try_close_pid(pid: int) -> None:
         if not sys.platform.startswith("win"):
             LOG.info("Not attempting to close notes editor PID %s on non-Windows platform", pid)
             return
-        subprocess.run(["taskkill", "/PID", str(pid), "/T", "/F"], check=False, capture_output=True)
+        # Terminate the editor and its children in-process (TerminateProcess via psutil)
+        # rather than spawning taskkill; fall back to taskkill if that is refused.
+        try:
+            editor = psutil.Process(pid)
+            for proc in editor.children(recursive=True) + [editor]:
+                try:
+                    proc.kill()
+                except psutil.NoSuchProcess:
+                    pass
+        except psutil.NoSuchProcess:
+            LOG.info("Notes editor PID %s has already exited", pid)
+            return
+        except psutil.Error:
+            subprocess.run(["taskkill", "/PID", str(pid), "/T", "/F"], check=False, capture_output=True)
         LOG.info("Attempted to close notes editor PID %s", pid)
     except Exception as exc:  # noqa: BLE001
         LOG.warning("Could not close notes editor PID %s: %s", pid, exc)
@@ -113,29 +172,30 @@ def run_post_acquisition(param_file: Any = None, overrides: Optional[Mapping[str
         notes_path = _resolve_notes_path(params)
 
         session_dir_param = params.get("output_session_folder")
-        session_dir = Path(str(session_dir_param)).expanduser().resolve() if session_dir_param else notes_path.parent
+        session_dir = (
+            Path(os.path.abspath(os.path.expanduser(str(session_dir_param)))) if session_dir_param else notes_path.parent
+        )
 
-        if not notes_path.exists():
+        if _create_if_missing(notes_path):
             LOG.warning("Experiment notes file not found at %s; creating empty file", notes_path)
-            notes_path.parent.mkdir(parents=True, exist_ok=True)
-            notes_path.touch()
 
         preview_enabled = params.get("experiment_notes_preview", True)
         preview_limit = params.get("experiment_notes_preview_limit")
         encoding = params.get("experiment_notes_encoding", "utf-8")
-        if preview_enabled:
-            _show_preview(notes_path, encoding, preview_limit)
-
         prompt = params.get("experiment_notes_confirm_prompt", _DEFAULT_CONFIRM_PROMPT)
         allow_no = bool(params.get("experiment_notes_allow_no", False))
         max_attempts = params.get("experiment_notes_confirm_max_attempts")
-        _show_preview(notes_path, encoding, preview_limit)  # fresh preview before confirmation
+        # One read serves both the preview and the editor PID lookup below.
+        notes_text = _show_preview(notes_path, encoding, preview_limit) if preview_enabled else None
         confirmed = _confirm_yes(prompt, param_utils.get_user_input, allow_no=allow_no, max_attempts=max_attempts)
         if not confirmed:
             return 1
 
         if params.get("experiment_notes_autoclose_editor", True):
-            pid = _extract_editor_pid(notes_path, encoding)
+            if notes_text is not None:
+                pid = _extract_editor_pid_from_text(notes_text)
+            else:
+                pid = _extract_editor_pid(notes_path, encoding)
             if pid:
                 _try_close_pid(pid)
 
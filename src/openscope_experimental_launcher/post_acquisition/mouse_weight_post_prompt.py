@@ -22,12 +22,12 @@ def run_post_acquisition(param_file):
             logging.error("No session or output folder found in parameters.")
             return 1
         weight_file = os.path.join(session_folder, "mouse_weight.csv")
-        # If file does not exist, create and write header
-        write_header = not os.path.exists(weight_file)
+        row = f"{datetime.now().isoformat()},post,{weight}\n"
         with open(weight_file, 'a') as f:
-            if write_header:
-                f.write("timestamp,stage,weight_g\n")
-            f.write(f"{datetime.now().isoformat()},post,{weight}\n")
+            # Append mode starts at end of file, so position 0 means the file is new (or empty): write header
+            if f.tell() == 0:
+                row = "timestamp,stage,weight_g\n" + row
+            f.write(row)
         logging.info(f"Post-acquisition: Collected mouse weight {weight}g and appended to {weight_file}.")
         return 0
     except Exception as e:
@@ -7,21 +7,33 @@ manifest to allow safe retries after interruptions.
 """
 from __future__ import annotations
 
+import concurrent.futures
 import json
 import logging
+import os
 import shutil
 import tempfile
+import threading
 import time
 from datetime import datetime, timezone
 from fnmatch import fnmatch
 from hashlib import new as new_hash
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+
+try:  # Python 3.11+: hashes into a reused buffer instead of allocating per chunk
+    from hashlib import file_digest
+except ImportError:  # pragma: no cover - older Python
+    file_digest = None
 
 from openscope_experimental_launcher.utils import param_utils
 
 LOG = logging.getLogger(__name__)
 
+_COPY_CHUNK_SIZE = 1024 * 1024
+# Files recorded between full manifest rewrites (each result is journaled immediately).
+_MANIFEST_CHECKPOINT_INTERVAL = 128
+
 
 class DeferredTransfer(RuntimeError):
     """Raised when a file cannot complete transfer but should be retried later."""
@@ -52,6 +64,7 @@ class SessionArchiver:
         remove_empty_dirs: bool = False,
         enable_network_copy: bool = True,
         enable_backup_copy: bool = True,
+        max_workers: int = 4,
     ) -> None:
         self.session_dir = session_dir
         self.network_dir = network_dir
@@ -67,7 +80,13 @@ class SessionArchiver:
         self.remove_empty_dirs = remove_empty_dirs
         self.enable_network_copy = bool(enable_network_copy)
         self.enable_backup_copy = bool(enable_backup_copy)
+        self.max_workers = max(1, int(max_workers))
+
+        # Guards the manifest and the result counters, which worker threads share.
+        self._lock = threading.Lock()
 
+        # (path, size, mtime_ns) -> digest of source files hashed so far
+        self._source_digests: Dict[Tuple[str, int, int], str] = {}
         self._manifest: Dict[str, Any] = {}
         if self.manifest_path.exists():
             self._load_manifest()
@@ -79,6 +98,15 @@ class SessionArchiver:
                 "backup_dir": str(self.backup_dir),
                 "files": {},
             }
+        # Per-file results are appended to a JSONL journal next to the manifest; the full
+        # manifest is only rewritten every _MANIFEST_CHECKPOINT_INTERVAL files and when run() ends.
+        self._journal_path = self.manifest_path.with_suffix(".jsonl")
+        # The archiver's own working files may live inside session_dir; never archive them.
+        self._state_dir = os.path.abspath(self.manifest_path.parent)
+        self._journal_name = self._journal_path.name
+        self._journal = None
+        self._unpersisted = 0
+        self._replay_journal()
         self.successful = 0
         self.failed = 0
         self.deferred = 0
@@ -128,33 +156,19 @@ class SessionArchiver:
         all_files = list(self._iter_session_files())
         total_files = len(all_files)
         LOG.warning("Session archiver started | files=%d | network=%s | backup=%s", total_files, self.enable_network_copy, self.enable_backup_copy)
-        iterator = iter(all_files)
-        last_progress = datetime.now(timezone.utc)
-        for file_path in iterator:
+        pending = []
+        for file_path in all_files:
             rel_path = file_path.relative_to(self.session_dir)
             rel_key = rel_path.as_posix()
-
             if self.skip_completed and self._manifest["files"].get(rel_key, {}).get("status") == "complete":
                 LOG.info("Skipping previously archived file '%s'", rel_key)
                 continue
+            pending.append((file_path, rel_path))
 
-            try:
-                network_allowed = (self._routing_paths is None) or (rel_key in self._routing_rel)
-                transferred = self._process_single_file(file_path, rel_path, network_allowed=network_allowed)
-                bytes_transferred += transferred
-                self.successful += 1
-            except DeferredTransfer as exc:
-                self.deferred += 1
-                LOG.warning(
-                    "Deferred cleanup for '%s': %s",
-                    exc.rel_key,
-                    exc.message,
-                )
-            except Exception as exc:  # noqa: BLE001
-                self.failed += 1
-                LOG.error("Failed to archive '%s': %s", rel_key, exc, exc_info=True)
-                self._mark_file(rel_key, status="error", error=str(exc))
+        last_progress = datetime.now(timezone.utc)
 
+        def _report_progress() -> None:
+            nonlocal last_progress
             now = datetime.now(timezone.utc)
             if (now - last_progress).total_seconds() >= 10:
                 processed = self.successful + self.failed + self.deferred
@@ -168,6 +182,30 @@ class SessionArchiver:
                 )
                 last_progress = now
 
+        workers = min(self.max_workers, len(pending))
+        try:
+            if workers > 1:
+                # Copies, hashing and backup writes block in C code that releases the GIL, so
+                # files on different devices (session disk, network share, backup disk) overlap.
+                with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [executor.submit(self._archive_file, *item) for item in pending]
+                    try:
+                        for future in concurrent.futures.as_completed(futures):
+                            bytes_transferred += future.result()
+                            _report_progress()
+                    except BaseException:
+                        # Drop queued files so Ctrl+C (or a failure) does not wait for
+                        # the executor to archive everything on shutdown.
+                        for queued in futures:
+                            queued.cancel()
+                        raise
+            else:
+                for item in pending:
+                    bytes_transferred += self._archive_file(*item)
+                    _report_progress()
+        finally:
+            self._close_journal()
+
         if self.remove_empty_dirs and not self.dry_run:
             self._prune_empty_directories()
 
@@ -181,6 +219,31 @@ class SessionArchiver:
             elapsed,
         )
 
+    def _archive_file(self, file_path: Path, rel_path: Path) -> int:
+        """Archive one file, recording the outcome; return the bytes sent to the network."""
+        rel_key = rel_path.as_posix()
+        try:
+            network_allowed = (self._routing_paths is None) or (rel_key in self._routing_rel)
+            transferred = self._process_single_file(file_path, rel_path, network_allowed=network_allowed)
+        except DeferredTransfer as exc:
+            with self._lock:
+                self.deferred += 1
+            LOG.warning(
+                "Deferred cleanup for '%s': %s",
+                exc.rel_key,
+                exc.message,
+            )
+            return 0
+        except Exception as exc:  # noqa: BLE001
+            with self._lock:
+                self.failed += 1
+            LOG.error("Failed to archive '%s': %s", rel_key, exc, exc_info=True)
+            self._mark_file(rel_key, status="error", error=str(exc))
+            return 0
+        with self._lock:
+            self.successful += 1
+        return transferred
+
     @staticmethod
     def _normalize_patterns(patterns: Iterable[str] | None, *, default: Optional[str] = None) -> list[str]:
         if patterns is None:
@@ -210,7 +273,16 @@ class SessionArchiver:
             if path not in yielded:
                 yield path
 
+    def _is_archiver_state_file(self, path: Path) -> bool:
+        """Return True for the journal and in-progress manifest temp files this archiver writes."""
+        name = path.name
+        if name != self._journal_name and not (name.startswith(".manifest_") and name.endswith(".json")):
+            return False
+        return os.path.abspath(path.parent) == self._state_dir
+
     def _should_transfer(self, path: Path) -> bool:
+        if self._is_archiver_state_file(path):
+            return False
         rel = path.relative_to(self.session_dir).as_posix()
         if any(fnmatch(rel, pattern) or fnmatch(path.name, pattern) for pattern in self.exclude_patterns):
             return False
@@ -247,25 +319,36 @@ class SessionArchiver:
             return 0
 
         retries = 0
-        file_size = source.stat().st_size if source.exists() else 0
+        source_stat = source.stat()
+        file_size = source_stat.st_size
+        sent_to_network = False
         while True:
             try:
                 entry_fields: Dict[str, Any] = {
                     "network_copy": self.enable_network_copy and network_allowed,
                     "backup_copy": self.enable_backup_copy,
+                    "src_size": source_stat.st_size,
+                    "src_mtime_ns": source_stat.st_mtime_ns,
+                    "checksum_algo": self.checksum_algo,
                 }
 
                 if self.enable_network_copy and network_allowed:
                     if dest_path is None:
                         raise ValueError("Destination path unavailable for network copy")
-                    self._copy_with_temp(source, dest_path)
-                    checksum = self._verify_checksum(source, dest_path)
+                    previous = self._manifest["files"].get(rel_key, {})
+                    if self._network_copy_current(source_stat, dest_path, previous):
+                        LOG.info("Network copy of '%s' already matches source; not recopying", rel_key)
+                        checksum = previous["checksum"]
+                        entry_fields["network_skipped_reason"] = "stat_match"
+                    else:
+                        checksum = self._verify_checksum(self._copy_with_temp(source, dest_path), source, dest_path)
+                        sent_to_network = True
                     entry_fields["checksum"] = checksum
                     entry_fields["network_path"] = str(dest_path)
                 elif self.enable_backup_copy:
-                    entry_fields["checksum"] = self._compute_digest(source)
+                    entry_fields["checksum"] = self._source_digest(source)
                 else:
-                    entry_fields["checksum"] = self._compute_digest(source)
+                    entry_fields["checksum"] = self._source_digest(source)
 
                 if self.enable_backup_copy:
                     if backup_path is None:
@@ -302,7 +385,26 @@ class SessionArchiver:
                     self.max_retries,
                     exc_info=True,
                 )
-        return file_size if self.enable_network_copy else 0
+        return file_size if sent_to_network else 0
+
+    def _network_copy_current(self, source_stat: os.stat_result, dest_path: Path, previous: Dict[str, Any]) -> bool:
+        """True if a verified copy from an earlier attempt is still in place for an unchanged source.
+
+        The earlier entry must have recorded this source's size and mtime and a checksum
+        made with the current algorithm, and the destination must still carry the size
+        and mtime (copystat gives the copy the source mtime).
+        """
+        if not previous.get("checksum") or previous.get("network_path") != str(dest_path):
+            return False
+        if previous.get("checksum_algo") != self.checksum_algo:
+            return False
+        if previous.get("src_size") != source_stat.st_size or previous.get("src_mtime_ns") != source_stat.st_mtime_ns:
+            return False
+        try:
+            dest_stat = dest_path.stat()
+        except OSError:
+            return False
+        return dest_stat.st_size == source_stat.st_size and dest_stat.st_mtime_ns == source_stat.st_mtime_ns
 
     def _log_transfer_summary(self, bytes_transferred: int, elapsed_seconds: float) -> None:
         if bytes_transferred <= 0:
@@ -323,34 +425,74 @@ class SessionArchiver:
             mb_per_second,
         )
 
-    def _copy_with_temp(self, src: Path, dest: Path) -> None:
+    def _copy_with_temp(self, src: Path, dest: Path) -> str:
+        """Copy ``src`` to ``dest`` via a temp file; return the digest of the bytes copied.
+
+        The source is hashed while it is streamed, so it is read once rather than
+        once for the copy and again for the checksum.
+        """
         dest.parent.mkdir(parents=True, exist_ok=True)
+        hasher = self._new_hasher()
         with tempfile.NamedTemporaryFile(delete=False, dir=dest.parent, prefix=".tmp_copy_", suffix=dest.suffix) as tmp:
             temp_path = Path(tmp.name)
         try:
-            shutil.copy2(src, temp_path)
+            buffer = bytearray(_COPY_CHUNK_SIZE)
+            view = memoryview(buffer)
+            with src.open("rb") as handle, temp_path.open("wb") as out:
+                while True:
+                    count = handle.readinto(buffer)
+                    if not count:
+                        break
+                    chunk = view[:count]
+                    hasher.update(chunk)
+                    out.write(chunk)
+            shutil.copystat(src, temp_path)
             temp_path.replace(dest)
         finally:
             if temp_path.exists() and not dest.exists():
                 temp_path.unlink(missing_ok=True)
+        return hasher.hexdigest()
 
-    def _verify_checksum(self, src: Path, dest: Path) -> str:
-        src_hash = self._compute_digest(src)
+    def _verify_checksum(self, expected: str, src: Path, dest: Path) -> str:
         dest_hash = self._compute_digest(dest)
-        if src_hash != dest_hash:
-            raise IOError(f"Checksum mismatch for '{src}' (expected {src_hash}, got {dest_hash})")
-        return src_hash
+        if expected != dest_hash:
+            raise IOError(f"Checksum mismatch for '{src}' (expected {expected}, got {dest_hash})")
+        return expected
 
-    def _compute_digest(self, file_path: Path, chunk_size: int = 1024 * 1024) -> str:
+    def _new_hasher(self):
         try:
-            hasher = new_hash(self.checksum_algo)
+            return new_hash(self.checksum_algo)
         except ValueError as exc:  # unknown algorithm
             raise ValueError(f"Unsupported checksum algorithm: {self.checksum_algo}") from exc
-        with file_path.open("rb") as handle:
-            while data := handle.read(chunk_size):
-                hasher.update(data)
+
+    def _compute_digest(self, file_path: Path, chunk_size: int = _COPY_CHUNK_SIZE) -> str:
+        hasher = self._new_hasher()
+        # Unbuffered: both paths read straight into their own buffer, so a BufferedReader adds nothing.
+        with file_path.open("rb", buffering=0) as handle:
+            if file_digest is not None:
+                return file_digest(handle, lambda: hasher).hexdigest()
+            buffer = bytearray(chunk_size)
+            view = memoryview(buffer)
+            while True:
+                count = handle.readinto(buffer)
+                if not count:
+                    break
+                hasher.update(view[:count])
         return hasher.hexdigest()
 
+    def _source_digest(self, file_path: Path) -> str:
+        """Digest of a source file, reused across retries while the file is unchanged.
+
+        Destination files are always hashed afresh: a recopied destination gets the
+        source's size and mtime, so a stale entry could hide a bad copy.
+        """
+        stat = file_path.stat()
+        key = (str(file_path), stat.st_size, stat.st_mtime_ns)
+        digest = self._source_digests.get(key)
+        if digest is None:
+            digest = self._source_digests[key] = self._compute_digest(file_path)
+        return digest
+
     def _copy_to_backup(self, src: Path, backup_path: Path) -> None:
         backup_path.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy2(src, backup_path)
@@ -361,9 +503,13 @@ class SessionArchiver:
             "updated_at": datetime.now(timezone.utc).isoformat(),
         }
         entry.update(fields)
-        self._manifest.setdefault("files", {})[rel_key] = entry
-        self._manifest["updated_at"] = datetime.now(timezone.utc).isoformat()
-        self._persist_manifest()
+        with self._lock:
+            self._manifest.setdefault("files", {})[rel_key] = entry
+            self._manifest["updated_at"] = datetime.now(timezone.utc).isoformat()
+            self._append_journal(rel_key, entry)
+            self._unpersisted += 1
+            if self._unpersisted >= _MANIFEST_CHECKPOINT_INTERVAL:
+                self._checkpoint_manifest()
 
     def _load_manifest(self) -> None:
         with self.manifest_path.open("r", encoding="utf-8") as handle:
@@ -374,6 +520,51 @@ class SessionArchiver:
         self._manifest.setdefault("files", {})
         LOG.info("Loaded existing manifest with %s entries", len(self._manifest["files"]))
 
+    def _replay_journal(self) -> None:
+        """Apply results journaled after the last manifest checkpoint (e.g. before a crash)."""
+        try:
+            handle = self._journal_path.open("r", encoding="utf-8")
+        except FileNotFoundError:
+            return
+        replayed = 0
+        with handle:
+            for line in handle:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break  # torn final line from an interrupted write
+                self._manifest.setdefault("files", {})[record["key"]] = record["entry"]
+                replayed += 1
+        if replayed:
+            LOG.info("Replayed %d archiver journal entries from %s", replayed, self._journal_path)
+            self._persist_manifest()
+        # Start a clean journal so new records never follow a torn line.
+        self._journal_path.unlink(missing_ok=True)
+
+    def _append_journal(self, rel_key: str, entry: Dict[str, Any]) -> None:
+        if self._journal is None:
+            self._journal_path.parent.mkdir(parents=True, exist_ok=True)
+            self._journal = self._journal_path.open("a", encoding="utf-8")
+        self._journal.write(json.dumps({"key": rel_key, "entry": entry}) + "\n")
+        self._journal.flush()
+
+    def _checkpoint_manifest(self) -> None:
+        """Rewrite the full manifest, then drop the journal entries it now contains."""
+        self._persist_manifest()
+        if self._journal is not None:
+            self._journal.seek(0)
+            self._journal.truncate()
+        self._unpersisted = 0
+
+    def _close_journal(self) -> None:
+        with self._lock:
+            if self._unpersisted:
+                self._checkpoint_manifest()
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            self._journal_path.unlink(missing_ok=True)
+
     def _persist_manifest(self) -> None:
         self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
         with tempfile.NamedTemporaryFile(
@@ -436,6 +627,7 @@ def run_post_acquisition(
         "skip_completed": True,
         "max_retries": 2,
         "remove_empty_dirs": False,
+        "max_workers": 4,
     }
     help_texts = {
         "session_dir": "Session output directory to archive",
@@ -595,6 +787,7 @@ def run_post_acquisition(
         enable_network_copy=move_to_network,
         enable_backup_copy=copy_to_backup,
         routing_manifest_path=routing_manifest_path,
+        max_workers=int(params.get("max_workers", defaults["max_workers"])),
     )
 
     LOG.info("Session directory: %s", session_dir)
@@ -605,7 +798,13 @@ def run_post_acquisition(
         "Routing manifest: %s",
         f"{routing_manifest_path} (exists={routing_manifest_path.exists()})" if routing_manifest_path else "None",
     )
-    LOG.info("Dry run: %s | Checksum: %s | Retries: %s", archiver.dry_run, archiver.checksum_algo, archiver.max_retries)
+    LOG.info(
+        "Dry run: %s | Checksum: %s | Retries: %s | Workers: %s",
+        archiver.dry_run,
+        archiver.checksum_algo,
+        archiver.max_retries,
+        archiver.max_workers,
+    )
     LOG.info("Include patterns: %s", archiver.include_patterns)
     LOG.info("Exclude patterns: %s", archiver.exclude_patterns)
     LOG.info(
@@ -16,6 +16,7 @@ Usage:
     python session_creator.py <output_folder> --force  # Overwrite existing session.json
 """
 
+import functools
 import json
 import logging
 from pathlib import Path
@@ -43,6 +44,8 @@ class SessionCreator:
         self.launcher_metadata = {}
 
     def load_experiment_data(self) -> bool:
+        # Metadata is (re)loaded below; drop any Software built from the old copy.
+        self.__dict__.pop('_launcher_software', None)
         try:
             if self.end_state_file.exists():
                 with open(self.end_state_file, 'r') as f:
@@ -138,24 +141,27 @@ class SessionCreator:
         notes = experiment_data.get('experiment_notes')
         return notes if notes else None
 
+    @functools.cached_property
+    def _launcher_software(self) -> "Software":
+        """Validated Software entry for the launcher, built once per loaded metadata."""
+        # Flattened schema: no launcher_info/parameters; derive minimal stream
+        return Software(
+            name='Experimental Launcher',
+            version=self.launcher_metadata.get('version', 'unknown'),
+            url="https://github.com/AllenInstitute/openscope-experimental-launcher",
+            parameters=self.launcher_metadata.get('params', {})
+        )
+
     def _get_data_streams(self, start_time: datetime, end_time: Optional[datetime]) -> List:
         if not AIND_DATA_SCHEMA_AVAILABLE:
             return []
         streams = []
         try:
-            # Flattened schema: no launcher_info/parameters; derive minimal stream
-            launcher_name = 'Experimental Launcher'
-            parameters = self.launcher_metadata.get('params', {})
             launcher_stream = Stream(
                 stream_start_time=start_time,
                 stream_end_time=end_time,
                 stream_modalities=[StreamModality.BEHAVIOR],
-                software=[Software(
-                    name=launcher_name,
-                    version=self.launcher_metadata.get('version', 'unknown'),
-                    url="https://github.com/AllenInstitute/openscope-experimental-launcher",
-                    parameters=parameters
-                )]
+                software=[self._launcher_software]
             )
             streams.append(launcher_stream)
         except Exception as e:
@@ -167,7 +167,6 @@ def create_slap2_stream(plane: str, meta_path: str, session_start_time=None, har
     """Create a SLAP2 Stream for a given plane using aind-data-schema objects (only required fields)."""
     if not AIND_AVAILABLE:
         raise ImportError("aind-data-schema is not available")
-    from datetime import datetime
     logger.info(f"Reading pixel dilation from: {meta_path}")
     dmd_dilation_x, dmd_dilation_y = read_pixel_dilation(meta_path)
     dmd_dilation_x = _extract_scalar(dmd_dilation_x) if dmd_dilation_x is not None else None
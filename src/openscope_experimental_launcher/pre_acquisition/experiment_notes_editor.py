@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import os
 import shlex
 import subprocess
 from datetime import datetime
@@ -31,7 +32,8 @@ def _resolve_notes_path(params: Mapping[str, Any]) -> Path:
         base = params.get("output_session_folder")
         if not base:
             raise ValueError("output_session_folder is required to resolve experiment notes path")
-        path = (Path(str(base)).expanduser() / path).resolve()
+        # abspath is string-only; resolve() would query the filesystem for every component.
+        path = Path(os.path.abspath(os.path.join(os.path.expanduser(str(base)), path)))
     path.parent.mkdir(parents=True, exist_ok=True)
     return path
 
@@ -22,12 +22,10 @@ def run_pre_acquisition(param_file):
             logging.error("No session or output folder found in parameters.")
             return 1
         # If output_root_folder, create a session subfolder with timestamp
-        if not os.path.exists(session_folder):
-            os.makedirs(session_folder, exist_ok=True)
+        os.makedirs(session_folder, exist_ok=True)
         weight_file = os.path.join(session_folder, "mouse_weight.csv")
         with open(weight_file, 'w') as f:
-            f.write("timestamp,stage,weight_g\n")
-            f.write(f"{datetime.now().isoformat()},pre,{weight}\n")
+            f.write(f"timestamp,stage,weight_g\n{datetime.now().isoformat()},pre,{weight}\n")
         logging.info(f"Pre-acquisition: Collected mouse weight {weight}g and saved to {weight_file}.")
         return 0
     except Exception as e:
@@ -5,11 +5,21 @@ Contains helper functions for rig configuration, Git management,
 process monitoring, and post-experiment processing.
 """
 
-# Import functions from modules
-from . import rig_config
-from . import git_manager
-from . import process_monitor
-from . import github_issue_reporter
+import importlib
+
+# Submodules are imported on first access (PEP 562); github_issue_reporter pulls in
+# requests, which most utilities do not need.
+_LAZY_SUBMODULES = ("rig_config", "git_manager", "process_monitor", "github_issue_reporter")
+
+
+def __getattr__(name):
+    if name not in _LAZY_SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 __all__ = [
     "rig_config",
@@ -11,6 +11,7 @@ Design goals:
 
 from __future__ import annotations
 
+import io
 import json
 import logging
 import os
@@ -156,12 +157,32 @@ def _sanitize_log_tail(lines: List[str], *, include_subject_user: bool) -> List[
     return sanitized
 
 
+_TAIL_BLOCK_SIZE = 64 * 1024
+
+
 def _read_text_tail(path: str, *, max_lines: int) -> List[str]:
+    # Read backwards from the end in blocks so a long launcher log is not loaded whole.
+    if max_lines <= 0:
+        return []
     try:
-        with open(path, "r", encoding="utf-8", errors="replace") as f:
-            return _tail_lines(f.readlines(), max_lines)
+        with open(path, "rb") as f:
+            pos = f.seek(0, os.SEEK_END)
+            blocks = []
+            newlines = 0
+            while pos > 0 and newlines <= max_lines:
+                step = min(_TAIL_BLOCK_SIZE, pos)
+                pos -= step
+                f.seek(pos)
+                block = f.read(step)
+                blocks.append(block)
+                newlines += block.count(b"\n")
+        data = b"".join(reversed(blocks))
+        lines = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8", errors="replace").readlines()
     except Exception:
         return []
+    if pos > 0:
+        lines = lines[1:]  # the first line may start mid-line
+    return _tail_lines(lines, max_lines)
 
 
 def _read_text_full(path: str) -> List[str]:
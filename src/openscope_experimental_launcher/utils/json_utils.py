@@ -0,0 +1,103 @@
+"""JSON (de)serialization helpers that use orjson when it is installed.
+
+orjson is optional (``pip install .[speedups]``); without it the standard
+library ``json`` module is used. Output is always UTF-8 encoded bytes so
+callers can write files in binary mode.
+"""
+from __future__ import annotations
+
+import json
+import math
+import os
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional dependency
+    _orjson = None
+
+ORJSON_AVAILABLE = _orjson is not None
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Return True if ``obj`` contains a NaN or infinite float, which orjson writes as ``null``."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(value) for value in obj)
+    return False
+
+
+def dumps(obj: Any, *, indent: bool = True, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes (2-space indent unless ``indent`` is False).
+
+    With orjson the output is not byte-identical to the stdlib's: non-ASCII text
+    is written as UTF-8 rather than ``\\uXXXX`` escapes and floats may be spelled
+    differently (``0.00001`` rather than ``1e-05``), though both parse to the same
+    values. Payloads containing NaN or Infinity, which orjson would silently write
+    as ``null``, are serialized by the stdlib as ``NaN``/``Infinity`` instead.
+    Datetimes go through ``default`` like any other unknown type with either backend.
+    """
+    if _orjson is not None:
+        option = _orjson.OPT_NON_STR_KEYS | _orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= _orjson.OPT_INDENT_2
+        try:
+            data = _orjson.dumps(obj, default=default, option=option)
+        except TypeError:
+            # e.g. integers beyond 64 bits; let the stdlib handle (or reject) it.
+            pass
+        else:
+            # A non-finite float can only have become a null, so most payloads skip the scan.
+            if b"null" not in data or not _has_non_finite(obj):
+                return data
+    if indent:
+        text = json.dumps(obj, indent=2, default=default)
+    else:
+        text = json.dumps(obj, separators=(",", ":"), default=default)
+    return text.encode("utf-8")
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Parse JSON text or bytes."""
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except ValueError:
+            # orjson is stricter (e.g. NaN literals); keep stdlib behavior and errors.
+            pass
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode("utf-8-sig")
+    return json.loads(data)
+
+
+def load_file(path: Union[str, Path]) -> Any:
+    """Read and parse a JSON file."""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def dump_file(path: Union[str, Path], obj: Any, *, default: Optional[Callable[[Any], Any]] = None) -> None:
+    """Write ``obj`` as indented JSON, atomically.
+
+    The data goes to ``<path>.tmp``, is fsynced, and is then moved over ``path``
+    with ``os.replace``, so neither an interrupted write nor a power loss right
+    after the rename leaves a truncated file.
+    """
+    data = dumps(obj, default=default)
+    tmp_path = f"{os.fspath(path)}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -1,13 +1,27 @@
-import json
 import logging
+import os
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional, Union, Mapping
 
+from . import json_utils
+
+# Set to a truthy value (e.g. via ``run_launcher.py --yes``) to accept every prompt's default.
+NONINTERACTIVE_ENV_VAR = "OSL_NONINTERACTIVE"
+
+
+def is_noninteractive() -> bool:
+    """Return True when prompts should not wait for operator input."""
+    return os.environ.get(NONINTERACTIVE_ENV_VAR, "").strip().lower() not in {"", "0", "false", "no"}
+
+
 def get_user_input(prompt: str, default=None, cast_func=str):
     """
     Generic user input function for CLI, with default and type casting.
     Handles non-interactive environments by returning the default and logging a message.
     """
+    if is_noninteractive():
+        logging.info(f"Non-interactive mode; using default for prompt '{prompt}': {default}")
+        return cast_func(default)
     try:
         val = input(f"{prompt} [{default}]: ")
         if val.strip() == "":
@@ -36,8 +50,7 @@ def load_parameters(
         if isinstance(param_file, Mapping):
             params.update(param_file)
         else:
-            with open(Path(param_file)) as f:
-                params.update(json.load(f))
+            params.update(json_utils.load_file(Path(param_file)))
     if overrides:
         params.update(overrides)
     # Prompt for missing required fields
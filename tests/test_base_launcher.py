@@ -3,6 +3,7 @@ Unit tests for the BaseLauncher class.
 """
 
 import os
+import select
 import signal
 import datetime
 import pytest
@@ -99,6 +100,195 @@ class TestBaseLauncher:
         
         assert isinstance(errors, list)
 
+    def test_monitor_process_waits_for_output_drain(self):
+        """Output emitted right before exit is collected once monitoring returns."""
+        import subprocess
+        import sys
+
+        experiment = BaseLauncher()
+        experiment.process = subprocess.Popen(
+            [sys.executable, '-c', 'import sys; print("out"); print("err", file=sys.stderr)'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        experiment._start_output_readers()
+        experiment._monitor_process()
+
+        assert experiment._output_drained.is_set()
+        assert list(experiment.stdout_data) == ["out"]
+        assert list(experiment.stderr_data) == ["err"]
+
+    @pytest.mark.skipif(
+        not (hasattr(os, "pidfd_open") or hasattr(select, "kqueue") or os.name == "nt"),
+        reason="no event-driven process exit wait on this platform",
+    )
+    def test_polling_monitor_wakes_on_process_exit(self):
+        """The polling loop is woken by the process exiting, not by the end of its sleep interval."""
+        import subprocess
+        import sys
+        from openscope_experimental_launcher.launchers import base_launcher
+
+        real_wait = base_launcher._wait_for_exit
+        woke = []
+
+        def wait_for_exit(proc, timeout, waiter=None):
+            if waiter is None and os.name != "nt":
+                woke.append("no exit waiter")
+                return
+            # The child exits once stdin closes; with a 60s interval only that exit can
+            # end this wait.
+            proc.stdin.close()
+            real_wait(proc, 60, waiter)
+            woke.append(proc.poll())
+
+        experiment = BaseLauncher()
+        experiment.params["process_start_timeout_sec"] = 30
+        experiment.process = subprocess.Popen(
+            [sys.executable, '-c', 'import sys; sys.stdin.read()'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        experiment._start_output_readers()
+        with patch.object(base_launcher, "_wait_for_exit", side_effect=wait_for_exit):
+            experiment._monitor_process()
+        assert experiment.process.returncode == 0
+        assert woke == [0]
+
+    def test_repo_path_cached_until_repository_params_change(self, temp_dir):
+        """Script resolution and git provenance share one repository path lookup."""
+        experiment = BaseLauncher()
+        experiment.params.update({
+            "repository_url": "https://github.com/test/workflows.git",
+            "local_repository_path": temp_dir,
+            "script_path": "run.py",
+        })
+        repo_root = os.path.join(temp_dir, "workflows")
+        os.makedirs(repo_root, exist_ok=True)
+        open(os.path.join(repo_root, "run.py"), "w").close()
+
+        with patch(
+            'openscope_experimental_launcher.utils.git_manager.get_repository_path',
+            return_value=repo_root,
+        ) as mock_repo:
+            assert experiment._get_script_path() == os.path.join(repo_root, "run.py")
+            experiment._collect_git_revisions()
+            assert mock_repo.call_count == 1
+            experiment.params["local_repository_path"] = os.path.join(temp_dir, "other")
+            experiment._get_repo_path()
+            assert mock_repo.call_count == 2
+
+    def test_resource_log_appends_samples_as_json_array(self, temp_dir):
+        """Samples are appended in place and the file stays a valid JSON array."""
+        import json
+        import time
+
+        experiment = BaseLauncher()
+        experiment.params["resource_log_interval"] = 0.01
+        experiment._start_resource_logging(temp_dir)
+        log_file = os.path.join(temp_dir, "launcher_metadata", "resource_usage.json")
+        deadline = time.monotonic() + 10
+        while len(experiment._resource_log_data) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        experiment._stop_resource_logging()
+
+        with open(log_file) as f:
+            samples = json.load(f)
+        assert len(samples) == len(experiment._resource_log_data) >= 3
+        assert all("timestamp" in s for s in samples)
+        with open(log_file) as f:
+            lines = f.read().splitlines()[1:-1]
+        assert [line.rstrip(",") for line in lines] == [
+            json.dumps(s, separators=(",", ":")) for s in samples
+        ]
+
+    def test_run_from_params_reuses_console_handler(self, temp_dir):
+        """Repeated run_from_params calls keep one console handler and only update its level."""
+        import logging
+
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+        missing = os.path.join(temp_dir, "missing.json")
+        try:
+            with patch.object(BaseLauncher, 'run') as mock_run:
+                assert BaseLauncher.run_from_params(missing) is False
+            mock_run.assert_not_called()
+            handler = root.handlers[0]
+            assert BaseLauncher.run_from_params(missing, log_level="WARNING") is False
+            assert root.handlers == [handler]
+            assert handler.level == logging.WARNING
+        finally:
+            root.handlers[:] = saved_handlers
+            root.setLevel(saved_level)
+
+    def test_run_from_params_reports_missing_relative_param_file(self, temp_dir, monkeypatch):
+        """A ./-prefixed missing path is still reported as a missing parameter file."""
+        import logging
+
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+        monkeypatch.chdir(temp_dir)
+        try:
+            with patch('logging.error') as mock_error:
+                assert BaseLauncher.run_from_params("./nope.json") is False
+            mock_error.assert_any_call("Parameter file not found: ./nope.json")
+        finally:
+            root.handlers[:] = saved_handlers
+            root.setLevel(saved_level)
+
+    def test_run_batch_preserves_order(self, temp_dir):
+        """run_batch returns one result per parameter file, in order, across workers."""
+        files = [os.path.join(temp_dir, f"missing_{i}.json") for i in range(3)]
+        with patch('os.cpu_count', return_value=2):
+            assert BaseLauncher.run_batch(files, max_workers=8) == [False, False, False]
+        assert BaseLauncher.run_batch([]) == []
+
+    def test_resource_log_disabled_by_zero_interval(self, temp_dir):
+        """resource_log_interval <= 0 starts no logging thread and writes no file."""
+        experiment = BaseLauncher()
+        experiment.params["resource_log_interval"] = 0
+        experiment._start_resource_logging(temp_dir)
+        assert experiment._resource_log_thread is None
+        assert not os.path.exists(os.path.join(temp_dir, "launcher_metadata", "resource_usage.json"))
+        experiment._stop_resource_logging()
+
+    def test_output_buffers_are_bounded(self):
+        """Captured output keeps only the configured number of trailing lines."""
+        experiment = BaseLauncher()
+        experiment.params["output_tail_lines"] = 3
+        buffer = experiment._new_output_buffer()
+        buffer.extend(str(i) for i in range(10))
+        assert list(buffer) == ["7", "8", "9"]
+
+    def test_output_readers_skip_mock_pipes(self):
+        """Mock pipes are not read; real pipe objects are not mistaken for mocks."""
+        import io
+        from openscope_experimental_launcher.launchers.base_launcher import _is_mock
+
+        assert _is_mock(Mock()) and _is_mock(MagicMock())
+        assert not _is_mock(io.BytesIO(b""))
+
+        experiment = BaseLauncher()
+        experiment.process = Mock()
+        experiment._start_output_readers()
+        assert experiment._wait_for_output_drain(timeout=2.0)
+        experiment.process.stdout.readline.assert_not_called()
+        experiment.process.stderr.readline.assert_not_called()
+
+    def test_output_readers_decode_with_locale_encoding(self, monkeypatch):
+        """Bytes from the child are decoded with the locale code page, not forced UTF-8."""
+        import io
+        from openscope_experimental_launcher.launchers import base_launcher
+
+        monkeypatch.setattr(base_launcher, "_OUTPUT_ENCODING", "cp1252")
+        experiment = BaseLauncher()
+        experiment.process = Mock()
+        experiment.process.stdout = io.BytesIO("pixel size 2 \u00b5m\n".encode("cp1252"))
+        experiment.process.stderr = io.BytesIO(b"")
+        experiment._start_output_readers()
+        assert experiment._wait_for_output_drain(timeout=2.0)
+        assert list(experiment.stdout_data) == ["pixel size 2 \u00b5m"]
+
     def test_cleanup_success(self):
         """Test successful cleanup."""
         experiment = BaseLauncher()
@@ -247,6 +437,29 @@ class TestBaseLauncher:
         input_params_file = os.path.join(metadata_dir, "input_parameters.json")
         assert os.path.exists(input_params_file)
 
+    def test_write_json_documents_removes_tmp_files_after_failed_replace(self, temp_dir):
+        """A rename that fails partway leaves no .tmp files behind; transient locks are retried."""
+        from openscope_experimental_launcher.launchers import base_launcher
+
+        paths = [os.path.join(temp_dir, f"doc{i}.json") for i in range(3)]
+        real_replace = os.replace
+        calls = []
+
+        def flaky_replace(src, dst):
+            calls.append(dst)
+            if dst == paths[0] and len(calls) == 1:
+                raise PermissionError("locked")
+            if dst == paths[1]:
+                raise OSError("disk gone")
+            real_replace(src, dst)
+
+        with patch('os.replace', side_effect=flaky_replace), \
+             patch('time.sleep'):
+            with pytest.raises(OSError, match="disk gone"):
+                base_launcher._write_json_documents((path, {"i": i}) for i, path in enumerate(paths))
+
+        assert sorted(os.listdir(temp_dir)) == ["doc0.json"]
+
     def test_setup_continuous_logging(self, temp_dir):
         """Test setting up continuous logging."""
         experiment = BaseLauncher()
@@ -269,6 +482,35 @@ class TestBaseLauncher:
             mock_stop.assert_called_once()
             assert getattr(experiment, "_sigint_received", False) is True
 
+    def test_sigint_handler_installed_only_during_run(self):
+        """SIGINT routes to the launcher while run() executes and is restored afterwards."""
+        previous = signal.getsignal(signal.SIGINT)
+        seen = []
+
+        def setup_repository(params):
+            seen.append(signal.getsignal(signal.SIGINT))
+            return False
+
+        experiment = BaseLauncher()
+        with patch('openscope_experimental_launcher.utils.git_manager.setup_repository', side_effect=setup_repository):
+            assert signal.getsignal(signal.SIGINT) == previous
+            assert experiment.run() is False
+
+        assert seen == [experiment.signal_handler]
+        assert signal.getsignal(signal.SIGINT) == previous
+
+    def test_sigint_default_handler_restored(self):
+        """A previous SIG_DFL handler is put back as SIG_DFL, not Python's default handler."""
+        previous = signal.getsignal(signal.SIGINT)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        try:
+            experiment = BaseLauncher()
+            with patch('openscope_experimental_launcher.utils.git_manager.setup_repository', return_value=False):
+                experiment.run()
+            assert signal.getsignal(signal.SIGINT) is signal.SIG_DFL
+        finally:
+            signal.signal(signal.SIGINT, previous)
+
     def test_str_representation(self):
         """Test string representation of experiment."""
         experiment = BaseLauncher()
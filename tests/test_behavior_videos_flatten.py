@@ -0,0 +1,115 @@
+import errno
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from openscope_experimental_launcher.post_acquisition import behavior_videos_flatten
+
+
+def _make_session(tmp_path):
+    session = tmp_path / "session"
+    videos = session / "behavior-videos"
+    (videos / "cam1").mkdir(parents=True)
+    (videos / "cam2").mkdir(parents=True)
+    (videos / "cam1" / "video.avi").write_bytes(b"one")
+    (videos / "cam2" / "video.avi").write_bytes(b"two")
+    (videos / "cam2" / "notes.txt").write_text("skip me")
+    (session / "video.avi").write_bytes(b"existing")
+    return session
+
+
+def test_flatten_moves_videos_and_registers_manifest(tmp_path):
+    session = _make_session(tmp_path)
+    params = {
+        "output_session_folder": str(session),
+        "behavior_videos_extensions": [".AVI"],
+        "behavior_videos_destination": "flat",
+    }
+    assert behavior_videos_flatten.run_post_acquisition(params) == 0
+
+    assert (session / "flat" / "cam1" / "video.avi").read_bytes() == b"one"
+    assert (session / "flat" / "cam2" / "video.avi").read_bytes() == b"two"
+    assert not (session / "behavior-videos" / "cam1").exists()
+    assert (session / "behavior-videos" / "cam2" / "notes.txt").exists()
+
+    manifest = json.loads((session / "launcher_metadata" / "routing_manifest.json").read_text())
+    entries = manifest if isinstance(manifest, list) else manifest.get("entries", manifest)
+    assert any("flat/cam1/video.avi" in str(e) for e in entries)
+
+
+def test_move_falls_back_to_copy_across_devices(tmp_path):
+    src = tmp_path / "a.avi"
+    src.write_bytes(b"data")
+    dest = tmp_path / "b.avi"
+    with patch("os.replace", side_effect=OSError(errno.EXDEV, "cross-device")), \
+         patch("shutil.move") as mock_move:
+        behavior_videos_flatten._move(src, dest)
+    mock_move.assert_called_once_with(str(src), str(dest))
+
+    behavior_videos_flatten._move(src, dest)
+    assert dest.read_bytes() == b"data" and not src.exists()
+
+
+@pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="copy_file_range unavailable")
+def test_copy_uses_copy_file_range_for_large_files(tmp_path, monkeypatch):
+    src = tmp_path / "big.avi"
+    payload = os.urandom(4096) * 64
+    src.write_bytes(payload)
+    os.utime(src, (1_000_000, 1_000_000))
+    monkeypatch.setattr(behavior_videos_flatten, "_FAST_COPY_MIN_SIZE", 1024)
+    monkeypatch.setattr(behavior_videos_flatten, "_FAST_COPY_CHUNK", 4096)
+
+    dest = tmp_path / "copy.avi"
+    with patch("shutil.copy2") as mock_copy2:
+        behavior_videos_flatten._copy(src, dest)
+    mock_copy2.assert_not_called()
+    assert dest.read_bytes() == payload
+    assert os.stat(dest).st_mtime == 1_000_000
+
+    with patch("os.copy_file_range", side_effect=OSError(errno.EXDEV, "cross-device")):
+        behavior_videos_flatten._copy(src, tmp_path / "fallback.avi")
+    assert (tmp_path / "fallback.avi").read_bytes() == payload
+
+
+def test_walk_session_groups_files_under_outermost_root(tmp_path):
+    session = _make_session(tmp_path)
+    nested = session / "behavior-videos" / "cam1" / "behavior-videos"
+    nested.mkdir()
+    (nested / "inner.AVI").write_bytes(b"x")
+    (session / "other").mkdir()
+    (session / "other" / "stray.avi").write_bytes(b"y")
+
+    roots, files = behavior_videos_flatten._walk_session(session, "behavior-videos", frozenset({".avi"}))
+
+    root = session / "behavior-videos"
+    assert roots == [root]
+    assert sorted(p.relative_to(root).as_posix() for p in files[root]) == [
+        "cam1/behavior-videos/inner.AVI",
+        "cam1/video.avi",
+        "cam2/video.avi",
+    ]
+
+
+def test_next_available_probes_claimed_names_not_filesystem(tmp_path):
+    (tmp_path / "video.avi").write_bytes(b"")
+    claimed = {}
+    with patch("pathlib.Path.exists") as mock_exists:
+        picks = [behavior_videos_flatten._next_available(tmp_path / "video.avi", claimed) for _ in range(3)]
+    mock_exists.assert_not_called()
+    assert [p.name for p in picks] == ["video_dup1.avi", "video_dup2.avi", "video_dup3.avi"]
+    assert behavior_videos_flatten._next_available(tmp_path / "sub" / "video.avi", claimed).name == "video.avi"
+
+
+def test_remove_empty_dirs_prunes_bottom_up_and_keeps_root(tmp_path):
+    root = tmp_path / "behavior-videos"
+    (root / "a" / "b" / "c").mkdir(parents=True)
+    (root / "keep").mkdir()
+    (root / "keep" / "file.txt").write_text("x")
+
+    behavior_videos_flatten._remove_empty_dirs(root)
+
+    assert root.is_dir()
+    assert not (root / "a").exists()
+    assert (root / "keep" / "file.txt").exists()
@@ -0,0 +1,422 @@
+"""Tests for BonsaiLauncher path resolution and process setup helpers."""
+
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+from openscope_experimental_launcher.launchers.bonsai_launcher import BonsaiLauncher
+
+
+def _make_launcher(**params):
+    launcher = BonsaiLauncher()
+    launcher.params.update(params)
+    return launcher
+
+
+def test_resolve_bonsai_paths_is_cached(tmp_path):
+    launcher = _make_launcher(
+        repository_url="https://github.com/test/workflows.git",
+        local_repository_path=str(tmp_path),
+        bonsai_exe_path="bonsai/Bonsai.exe",
+    )
+    repo_root = os.path.join(str(tmp_path), "workflows")
+
+    with patch(
+        "openscope_experimental_launcher.utils.git_manager.get_repository_path",
+        return_value=repo_root,
+    ) as mock_repo:
+        first = launcher._resolve_bonsai_paths()
+        second = launcher._resolve_bonsai_paths()
+
+    assert first == second == {"bonsai_exe_path": os.path.join(repo_root, "bonsai/Bonsai.exe")}
+    mock_repo.assert_called_once()
+
+
+def test_resolve_bonsai_paths_recomputed_when_params_change(tmp_path):
+    exe = os.path.join(str(tmp_path), "Bonsai.exe")
+    launcher = _make_launcher(bonsai_exe_path=exe)
+    assert launcher._resolve_bonsai_paths() == {"bonsai_exe_path": exe}
+
+    other = os.path.join(str(tmp_path), "other", "Bonsai.exe")
+    launcher.params["bonsai_exe_path"] = other
+    assert launcher._resolve_bonsai_paths() == {"bonsai_exe_path": other}
+
+
+def test_start_workflow_redirects_output_to_files(tmp_path):
+    import sys
+    from openscope_experimental_launcher.interfaces import bonsai_interface
+
+    # Use the Python interpreter as a stand-in "Bonsai" executable.
+    script = tmp_path / "workflow.py"
+    script.write_text("import sys\nprint('hello')\nprint('boom', file=sys.stderr)\n")
+    stdout_log = tmp_path / "logs" / "bonsai_stdout.log"
+    stderr_log = tmp_path / "logs" / "bonsai_stderr.log"
+
+    proc = bonsai_interface.start_workflow(
+        str(script), sys.executable, stdout_log=str(stdout_log), stderr_log=str(stderr_log)
+    )
+    proc.wait(timeout=30)
+
+    assert proc.stdout is None and proc.stderr is None
+    assert stdout_log.read_text().strip() == "hello"
+    assert stderr_log.read_text().strip() == "boom"
+
+
+def test_output_log_tail_only_covers_current_attempt(tmp_path):
+    launcher = _make_launcher()
+    stderr_log = tmp_path / "bonsai_stderr.log"
+    stderr_log.write_text("previous attempt\n")
+
+    launcher._set_output_logs(None, str(stderr_log))
+    assert launcher._has_process_output() is False
+
+    with open(stderr_log, "a") as f:
+        f.write("current attempt\n")
+    assert launcher._has_process_output() is True
+    assert launcher._read_output_log_tail("stderr") == ["current attempt"]
+    assert launcher._read_output_log_tail("stdout") == []
+
+
+def test_repo_path_shared_by_path_and_script_resolution(tmp_path):
+    repo_root = tmp_path / "workflows"
+    repo_root.mkdir()
+    (repo_root / "task.bonsai").write_text("<Workflow />")
+    launcher = _make_launcher(
+        repository_url="https://github.com/test/workflows.git",
+        local_repository_path=str(tmp_path),
+        bonsai_exe_path="Bonsai.exe",
+        script_path="task.bonsai",
+    )
+
+    with patch(
+        "openscope_experimental_launcher.utils.git_manager.get_repository_path",
+        return_value=str(repo_root),
+    ) as mock_repo:
+        launcher._resolve_bonsai_paths()
+        assert launcher._get_script_path() == os.path.join(str(repo_root), "task.bonsai")
+
+    mock_repo.assert_called_once()
+
+
+def test_assign_to_job_object_reuses_popen_handle():
+    from types import SimpleNamespace
+    from openscope_experimental_launcher.launchers import bonsai_launcher
+
+    launcher = _make_launcher()
+    launcher.hJob = object()
+    launcher.process = SimpleNamespace(pid=1234, _handle=5678, poll=lambda: None)
+    win32job = SimpleNamespace(AssignProcessToJobObject=Mock())
+    win32api = SimpleNamespace(OpenProcess=Mock())
+
+    with patch.object(bonsai_launcher, "WINDOWS_MODULES_AVAILABLE", True), \
+         patch.object(bonsai_launcher, "win32job", win32job, create=True), \
+         patch.object(bonsai_launcher, "win32api", win32api, create=True):
+        launcher._assign_to_job_object()
+
+    win32job.AssignProcessToJobObject.assert_called_once_with(launcher.hJob, 5678)
+    win32api.OpenProcess.assert_not_called()
+
+
+def test_assign_to_job_object_skips_exited_process():
+    from types import SimpleNamespace
+    from openscope_experimental_launcher.launchers import bonsai_launcher
+
+    launcher = _make_launcher()
+    launcher.hJob = object()
+    launcher.process = SimpleNamespace(pid=1234, _handle=5678, poll=lambda: 0)
+    win32job = SimpleNamespace(AssignProcessToJobObject=Mock())
+
+    with patch.object(bonsai_launcher, "WINDOWS_MODULES_AVAILABLE", True), \
+         patch.object(bonsai_launcher, "win32job", win32job, create=True):
+        launcher._assign_to_job_object()
+
+    win32job.AssignProcessToJobObject.assert_not_called()
+
+
+def test_failure_report_is_a_single_log_record(caplog):
+    import logging
+
+    launcher = _make_launcher(bonsai_max_retries=0, bonsai_failure_default="abort")
+    process = Mock(returncode=3, pid=1)
+
+    def fake_monitor():
+        launcher.stderr_data.extend(["first error", "second error"])
+
+    with patch.object(launcher, "create_process", return_value=process), \
+         patch.object(launcher, "_start_output_readers"), \
+         patch.object(launcher, "_monitor_process", side_effect=fake_monitor), \
+         patch("openscope_experimental_launcher.utils.param_utils.get_user_input", return_value="a"), \
+         caplog.at_level(logging.ERROR):
+        assert launcher.start_experiment() is False
+
+    records = [r for r in caplog.records if "Bonsai workflow failed" in r.getMessage()]
+    assert len(records) == 1
+    assert records[0].getMessage().splitlines() == [
+        "Bonsai workflow failed (exit code 3). Remaining retries: 0",
+        "Bonsai stderr: first error",
+        "Bonsai stderr: second error",
+    ]
+
+
+def test_retry_patterns_compiled_once_into_single_regex():
+    launcher = _make_launcher(bonsai_retry_error_patterns=["Device not found", r"COM\d+ busy", "("])
+    with patch("re.compile", wraps=__import__("re").compile) as mock_compile:
+        first = launcher._get_retry_patterns()
+        calls = mock_compile.call_count
+        assert launcher._get_retry_patterns() is first
+        assert mock_compile.call_count == calls
+
+    retry_regex, compiled = first
+    assert [cre.pattern for cre in compiled] == ["Device not found", r"COM\d+ busy"]
+    assert retry_regex is not None
+    assert launcher._match_retry_pattern("error: COM3 busy", retry_regex, compiled) == r"COM\d+ busy"
+    assert launcher._match_retry_pattern("all good", retry_regex, compiled) is None
+
+    launcher.params["bonsai_retry_error_patterns"] = "other"
+    assert launcher._get_retry_patterns()[1][0].pattern == "other"
+
+
+def test_retry_patterns_with_backreferences_are_not_joined():
+    launcher = _make_launcher(bonsai_retry_error_patterns=[r"(a)\1", r"(b)\1"])
+    retry_regex, compiled = launcher._get_retry_patterns()
+    assert retry_regex is None
+    assert launcher._match_retry_pattern("xbb", retry_regex, compiled) == r"(b)\1"
+
+
+def test_retry_pattern_matched_while_streaming_terminates_early():
+    import subprocess
+    import sys
+    import time
+
+    launcher = _make_launcher(
+        bonsai_retry_error_patterns=["Device not found"],
+        bonsai_fail_on_stderr=False,
+        acquisition_error_terminate=True,
+        bonsai_max_retries=0,
+        bonsai_failure_default="abort",
+    )
+
+    def create_process():
+        return subprocess.Popen(
+            [sys.executable, "-c", "import time; print('Device not found', flush=True); time.sleep(30)"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+    started = time.monotonic()
+    with patch.object(launcher, "create_process", side_effect=create_process), \
+         patch("openscope_experimental_launcher.utils.param_utils.get_user_input", return_value="a"):
+        assert launcher.start_experiment() is False
+
+    assert time.monotonic() - started < 15
+    assert launcher._failure_reason == "log matched pattern 'Device not found'"
+
+
+def test_windows_job_object_shared_between_launchers():
+    from types import SimpleNamespace
+    from openscope_experimental_launcher.launchers import bonsai_launcher
+
+    job = object()
+    win32job = SimpleNamespace(
+        CreateJobObject=Mock(return_value=job),
+        QueryInformationJobObject=Mock(return_value={"BasicLimitInformation": {}}),
+        SetInformationJobObject=Mock(),
+        JobObjectExtendedLimitInformation=9,
+        JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE=0x2000,
+    )
+
+    with patch.object(bonsai_launcher, "WINDOWS_MODULES_AVAILABLE", True), \
+         patch.object(bonsai_launcher, "win32job", win32job, create=True), \
+         patch.object(bonsai_launcher, "_SHARED_JOB", None):
+        first = BonsaiLauncher()
+        second = BonsaiLauncher()
+
+    assert first.hJob is job and second.hJob is job
+    win32job.CreateJobObject.assert_called_once()
+    win32job.SetInformationJobObject.assert_called_once()
+
+
+def test_script_path_resolution_reused_across_attempts(tmp_path):
+    repo_root = tmp_path / "workflows"
+    repo_root.mkdir()
+    (repo_root / "main.bonsai").write_text("<WorkflowBuilder/>")
+    launcher = _make_launcher(
+        repository_url="https://github.com/test/workflows.git",
+        local_repository_path=str(tmp_path),
+        script_path="main.bonsai",
+    )
+
+    expected = os.path.join(str(repo_root), "main.bonsai")
+    with patch("os.path.isfile", wraps=os.path.isfile) as mock_isfile:
+        first = launcher._get_script_path()
+        second = launcher._get_script_path()
+
+    assert first == second == expected
+    # The workflow file is only stat'ed on the first attempt.
+    assert sum(c.args == (expected,) for c in mock_isfile.call_args_list) == 1
+
+
+def test_environment_setup_reused_across_attempts(tmp_path):
+    from openscope_experimental_launcher.interfaces import bonsai_interface
+
+    workflow = tmp_path / "main.bonsai"
+    workflow.write_text("<WorkflowBuilder/>")
+    launcher = _make_launcher(bonsai_exe_path=str(tmp_path / "Bonsai.exe"), script_path=str(workflow))
+
+    with patch.object(bonsai_interface, "setup_bonsai_environment", return_value=True) as mock_setup, \
+         patch.object(bonsai_interface, "start_workflow", return_value=Mock()):
+        launcher.create_process()
+        launcher.create_process()
+        assert mock_setup.call_count == 1
+
+        launcher.params["bonsai_exe_path"] = str(tmp_path / "other" / "Bonsai.exe")
+        launcher.create_process()
+        assert mock_setup.call_count == 2
+
+
+def test_failed_environment_setup_is_retried(tmp_path):
+    from openscope_experimental_launcher.interfaces import bonsai_interface
+
+    launcher = _make_launcher(bonsai_exe_path=str(tmp_path / "Bonsai.exe"))
+    with patch.object(bonsai_interface, "setup_bonsai_environment", return_value=False) as mock_setup:
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                launcher.create_process()
+    assert mock_setup.call_count == 2
+
+
+def test_stop_interrupts_retry_delay():
+    import threading
+    import time
+
+    launcher = _make_launcher(
+        bonsai_max_retries=1,
+        bonsai_retry_delay_sec=30,
+        bonsai_failure_default="retry",
+    )
+    process = Mock(returncode=1, pid=1)
+    process.poll.return_value = 1
+
+    with patch.object(launcher, "create_process", return_value=process) as mock_create, \
+         patch.object(launcher, "_start_output_readers"), \
+         patch.object(launcher, "_monitor_process"), \
+         patch("openscope_experimental_launcher.utils.param_utils.get_user_input", return_value="r"):
+        threading.Timer(0.2, launcher.stop).start()
+        started = time.monotonic()
+        assert launcher.start_experiment() is False
+
+    assert time.monotonic() - started < 10
+    mock_create.assert_called_once()
+
+
+def test_exit_code_read_after_monitoring_stops_early():
+    import subprocess
+    import sys
+
+    launcher = _make_launcher(bonsai_max_retries=0, bonsai_failure_default="abort", bonsai_fail_on_stderr=False)
+
+    def create_process():
+        return subprocess.Popen([sys.executable, "-c", "import time, sys; time.sleep(0.3); sys.exit(4)"])
+
+    with patch.object(launcher, "create_process", side_effect=create_process), \
+         patch.object(launcher, "_monitor_process"), \
+         patch("openscope_experimental_launcher.utils.param_utils.get_user_input", return_value="a"):
+        assert launcher.start_experiment() is False
+
+    assert launcher.process.returncode == 4
+
+
+def test_parallel_setup_overlaps_path_check_with_environment_setup(tmp_path):
+    import threading
+    from openscope_experimental_launcher.interfaces import bonsai_interface
+
+    workflow = tmp_path / "main.bonsai"
+    workflow.write_text("<WorkflowBuilder/>")
+    launcher = _make_launcher(
+        bonsai_exe_path=str(tmp_path / "Bonsai.exe"),
+        script_path=str(workflow),
+        bonsai_parallel_setup=True,
+    )
+    path_checked = threading.Event()
+    original = launcher._get_script_path
+
+    def get_script_path():
+        result = original()
+        path_checked.set()
+        return result
+
+    def setup(params):
+        # Only completes if the path check runs concurrently.
+        return path_checked.wait(5)
+
+    with patch.object(launcher, "_get_script_path", side_effect=get_script_path), \
+         patch.object(bonsai_interface, "setup_bonsai_environment", side_effect=setup), \
+         patch.object(bonsai_interface, "start_workflow", return_value=Mock()) as mock_start:
+        launcher.create_process()
+
+    assert mock_start.call_args.kwargs["workflow_path"] == str(workflow)
+
+
+def test_parallel_setup_reports_environment_failure_first(tmp_path):
+    from openscope_experimental_launcher.interfaces import bonsai_interface
+
+    launcher = _make_launcher(
+        bonsai_exe_path=str(tmp_path / "Bonsai.exe"),
+        script_path=str(tmp_path / "missing.bonsai"),
+        bonsai_parallel_setup=True,
+    )
+    with patch.object(bonsai_interface, "setup_bonsai_environment", return_value=False):
+        with pytest.raises(RuntimeError, match="Failed to setup Bonsai environment"):
+            launcher.create_process()
+
+
+def test_script_path_existence_checked_once_unless_recheck_requested(tmp_path):
+    workflow = tmp_path / "main.bonsai"
+    workflow.write_text("<WorkflowBuilder/>")
+    launcher = _make_launcher(script_path=str(workflow))
+
+    with patch("os.path.isfile", wraps=os.path.isfile) as mock_isfile:
+        launcher._get_script_path()
+        launcher._get_script_path()
+        assert mock_isfile.call_count == 1
+
+        launcher.params["recheck_script_path"] = True
+        launcher._get_script_path()
+        assert mock_isfile.call_count == 2
+
+    workflow.unlink()
+    with pytest.raises(RuntimeError, match="Bonsai workflow not found"):
+        launcher._get_script_path()
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [(None, None), ("", None), ("  ", None), (0, 0), (3, 3), (-1, None), ("2", 2), ("-5", None), (2.0, 2)],
+)
+def test_parse_max_retries(value, expected):
+    assert BonsaiLauncher._parse_max_retries(value) == expected
+
+
+def test_parse_max_retries_rejects_garbage():
+    with pytest.raises(ValueError):
+        BonsaiLauncher._parse_max_retries("many")
+
+
+def test_process_terminated_when_still_running_after_monitoring(monkeypatch):
+    import subprocess
+    import sys
+    from openscope_experimental_launcher.launchers import bonsai_launcher
+
+    monkeypatch.setattr(bonsai_launcher, "_POST_MONITOR_EXIT_TIMEOUT_SEC", 0.2)
+    launcher = _make_launcher(bonsai_max_retries=0, bonsai_failure_default="abort", bonsai_fail_on_stderr=False)
+
+    def create_process():
+        return subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+
+    with patch.object(launcher, "create_process", side_effect=create_process), \
+         patch.object(launcher, "_monitor_process"), \
+         patch("openscope_experimental_launcher.utils.param_utils.get_user_input", return_value="a"):
+        assert launcher.start_experiment() is False
+
+    assert launcher.process.poll() is not None
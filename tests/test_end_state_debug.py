@@ -48,6 +48,19 @@ class TestEndStateDebugState:
         assert debug_state["crash_info"]["message"] == "Test error for debugging"
         assert "crash_time" in debug_state["crash_info"]
 
+    def test_debug_state_writes_output_separately(self, tmp_path):
+        """Captured output is written beside debug_state.json, not embedded in it."""
+        launcher = BaseLauncher()
+        launcher.stderr_data.extend(["first error", "second error"])
+        launcher.save_debug_state(str(tmp_path), RuntimeError("boom"))
+        md_dir = tmp_path / "launcher_metadata"
+        with open(md_dir / "debug_state.json") as f:
+            state = json.load(f)["launcher_state"]
+        assert state["stderr_data"] == {"file": "debug_stderr.log", "lines": 2}
+        assert state["stdout_data"] == {"file": None, "lines": 0}
+        assert (md_dir / "debug_stderr.log").read_text(encoding="utf-8") == "first error\nsecond error\n"
+        assert not (md_dir / "debug_stdout.log").exists()
+
     def test_debug_state_on_crash(self, tmp_path):
         """Test that debug state is saved when run() crashes."""
         
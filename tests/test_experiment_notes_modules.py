@@ -51,3 +51,114 @@ def test_experiment_notes_post_prompts_for_confirmation(tmp_path, monkeypatch):
     assert notes_path.exists()
     assert captured["prompt"] == experiment_notes_finalize._DEFAULT_CONFIRM_PROMPT
     assert captured["default"] == ""
+
+
+def test_experiment_notes_post_creates_missing_file_once(tmp_path, monkeypatch):
+    session_dir = tmp_path / "session"
+    session_dir.mkdir()
+    notes_path = session_dir / "experiment_notes.txt"
+
+    monkeypatch.setattr(experiment_notes_finalize.param_utils, "get_user_input", lambda prompt, default: "yes")
+
+    assert experiment_notes_finalize._create_if_missing(notes_path) is True
+    notes_path.write_text("kept", encoding="utf-8")
+    assert experiment_notes_finalize._create_if_missing(notes_path) is False
+
+    assert experiment_notes_finalize.run_post_acquisition(_base_params(session_dir)) == 0
+    assert notes_path.read_text(encoding="utf-8") == "kept"
+
+
+def test_experiment_notes_post_reads_notes_once(tmp_path, monkeypatch):
+    session_dir = tmp_path / "session"
+    session_dir.mkdir()
+    notes_path = session_dir / "experiment_notes.txt"
+    notes_path.write_text("# EditorPID: 4242\nnote content\n", encoding="utf-8")
+
+    reads = []
+    original_read_text = Path.read_text
+
+    def counting_read_text(self, *args, **kwargs):
+        reads.append(self)
+        return original_read_text(self, *args, **kwargs)
+
+    closed = []
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    monkeypatch.setattr(experiment_notes_finalize.param_utils, "get_user_input", lambda prompt, default: "yes")
+    monkeypatch.setattr(experiment_notes_finalize, "_try_close_pid", closed.append)
+
+    assert experiment_notes_finalize.run_post_acquisition(_base_params(session_dir)) == 0
+    assert reads == [notes_path]
+    assert closed == [4242]
+
+
+def test_extract_editor_pid_from_text_matches_line_start_only():
+    extract = experiment_notes_finalize._extract_editor_pid_from_text
+    assert extract("# EditorPID: 12\r\nnotes") == 12
+    assert extract("notes mention # EditorPID: 1\n# EditorPID: 34") == 34
+    assert extract("notes\n# EditorPID: abc\n") is None
+    assert extract("no marker here") is None
+
+
+def test_show_preview_skips_read_when_info_disabled(tmp_path, monkeypatch):
+    notes_path = tmp_path / "experiment_notes.txt"
+    notes_path.write_text("note content", encoding="utf-8")
+
+    def fail_read(*args, **kwargs):
+        raise AssertionError("notes file should not be read")
+
+    monkeypatch.setattr(experiment_notes_finalize.LOG, "isEnabledFor", lambda level: False)
+    monkeypatch.setattr(Path, "read_text", fail_read)
+    assert experiment_notes_finalize._show_preview(notes_path, "utf-8", None) is None
+
+
+def test_confirm_yes_waits_between_empty_responses(monkeypatch):
+    responses = iter([None, None, "Y"])
+    sleeps = []
+    monkeypatch.setattr(experiment_notes_finalize.time, "sleep", sleeps.append)
+
+    confirmed = experiment_notes_finalize._confirm_yes(
+        "prompt", lambda prompt, default: next(responses), allow_no=False, max_attempts=None
+    )
+    assert confirmed is True
+    assert sleeps == [experiment_notes_finalize._NO_RESPONSE_RETRY_DELAY] * 2
+
+
+def test_show_preview_logs_notes_text_verbatim(tmp_path, caplog):
+    notes_path = tmp_path / "experiment_notes.txt"
+    notes_path.write_text("100% done %s", encoding="utf-8")
+
+    with caplog.at_level("INFO", logger=experiment_notes_finalize.LOG.name):
+        text = experiment_notes_finalize._show_preview(notes_path, "utf-8", None)
+
+    assert text == "100% done %s"
+    assert "100% done %s" in [record.getMessage() for record in caplog.records]
+
+
+def test_confirm_yes_gives_up_after_repeated_empty_responses(monkeypatch):
+    monkeypatch.setattr(experiment_notes_finalize.time, "sleep", lambda delay: None)
+    calls = []
+
+    def no_response(prompt, default):
+        calls.append(prompt)
+        return None
+
+    assert experiment_notes_finalize._confirm_yes("prompt", no_response, allow_no=False, max_attempts=4) is False
+    assert len(calls) == 4
+
+
+def test_try_close_pid_kills_editor_tree_without_taskkill(monkeypatch):
+    from unittest.mock import MagicMock
+
+    child, editor = MagicMock(), MagicMock()
+    editor.children.return_value = [child]
+    monkeypatch.setattr(experiment_notes_finalize.sys, "platform", "win32")
+    monkeypatch.setattr(experiment_notes_finalize.psutil, "Process", lambda pid: editor)
+    run = MagicMock()
+    monkeypatch.setattr(experiment_notes_finalize.subprocess, "run", run)
+
+    experiment_notes_finalize._try_close_pid(1234)
+
+    editor.children.assert_called_once_with(recursive=True)
+    child.kill.assert_called_once_with()
+    editor.kill.assert_called_once_with()
+    run.assert_not_called()
@@ -248,3 +248,16 @@ def test_stage_failure_respects_report_on(tmp_path, monkeypatch):
         output_directory=str(tmp_path),
     )
     assert url is None
+
+
+def test_read_text_tail_matches_full_read(tmp_path, monkeypatch):
+    """Tail mode reads from the end of the log but returns the same lines as a full read."""
+    monkeypatch.setattr(github_issue_reporter, "_TAIL_BLOCK_SIZE", 7)
+    log_path = tmp_path / "launcher.log"
+    log_path.write_bytes(b"".join(b"line %d \xc3\xa9\r\n" % i for i in range(50)) + b"\nlast")
+
+    expected = github_issue_reporter._read_text_full(str(log_path))[-5:]
+    assert github_issue_reporter._read_text_tail(str(log_path), max_lines=5) == expected
+    assert github_issue_reporter._read_text_tail(str(log_path), max_lines=500) == (
+        github_issue_reporter._read_text_full(str(log_path))
+    )
@@ -0,0 +1,88 @@
+"""Tests for the optional-orjson JSON helpers."""
+
+import json
+import math
+
+import pytest
+
+from openscope_experimental_launcher.utils import json_utils
+
+
+@pytest.fixture(params=["default", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(json_utils, "_orjson", None)
+    return request.param
+
+
+def test_dumps_round_trip(backend):
+    payload = {"subject_id": "mouse", "values": [1, 2.5, None, True], "nested": {"a": "b"}}
+    data = json_utils.dumps(payload)
+    assert isinstance(data, bytes)
+    assert json.loads(data) == payload
+    assert json_utils.loads(data) == payload
+    assert json_utils.loads(data.decode("utf-8")) == payload
+
+
+def test_dumps_uses_default_for_unknown_types(backend):
+    from pathlib import PurePosixPath
+
+    data = json_utils.dumps({"path": PurePosixPath("/tmp/x")}, default=str)
+    assert json.loads(data) == {"path": "/tmp/x"}
+
+
+def test_dumps_parses_to_stdlib_values(backend):
+    from datetime import datetime
+
+    payload = {
+        "unit": "\u00b5m",
+        "values": [1e-05, 1e20, 0.5, 1],
+        "start_time": datetime(2024, 1, 2, 3, 4, 5),
+    }
+    expected = json.loads(json.dumps(payload, default=str))
+    assert json.loads(json_utils.dumps(payload, default=str)) == expected
+    compact = json_utils.dumps(payload, indent=False, default=str)
+    assert b"\n" not in compact
+    assert json.loads(compact) == expected
+
+
+def test_dumps_falls_back_to_stdlib_for_big_ints(backend):
+    payload = {"a": 2**70}
+    assert json_utils.dumps(payload) == json.dumps(payload, indent=2).encode("utf-8")
+
+
+def test_dumps_keeps_non_finite_floats(backend):
+    payload = {"a": float("nan"), "b": [float("inf"), -float("inf")], "c": None}
+    expected = json.dumps(payload, indent=2).encode("utf-8")
+    assert json_utils.dumps(payload) == expected
+    restored = json_utils.loads(json_utils.dumps(payload))
+    assert math.isnan(restored["a"])
+    assert restored["b"] == [float("inf"), -float("inf")]
+    assert restored["c"] is None
+
+
+def test_loads_accepts_stdlib_only_syntax(backend):
+    assert json_utils.loads('{"value": NaN}')["value"] != 0
+
+
+def test_load_file_handles_utf8_bom(backend, tmp_path):
+    path = tmp_path / "params.json"
+    path.write_bytes(b"\xef\xbb\xbf" + json.dumps({"user_id": "tester"}).encode("utf-8"))
+    assert json_utils.load_file(path) == {"user_id": "tester"}
+
+
+def test_loads_invalid_raises_value_error(backend):
+    with pytest.raises(ValueError):
+        json_utils.loads("{not json")
+
+
+def test_dump_file_replaces_atomically(backend, tmp_path):
+    path = tmp_path / "end_state.json"
+    path.write_text('{"old": true}')
+    json_utils.dump_file(path, {"new": True})
+    assert json.loads(path.read_text()) == {"new": True}
+
+    with pytest.raises(TypeError):
+        json_utils.dump_file(path, {"bad": object()})
+    assert json.loads(path.read_text()) == {"new": True}
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["end_state.json"]
@@ -68,3 +68,61 @@ def test_default_entrypoint_args_inject_execute_for_slap2():
 def test_default_entrypoint_args_skip_for_custom_entrypoint():
     args = matlab_interface._build_entrypoint_args({}, None, "custom_launcher")
     assert args == []
+
+
+class _FakeEngine:
+    def __init__(self, alive=True):
+        self.alive = alive
+        self.quit_calls = 0
+
+    def eval(self, command, nargout=0):
+        if not self.alive:
+            raise RuntimeError("engine gone")
+
+    def quit(self):
+        self.quit_calls += 1
+
+
+def _connect_with(monkeypatch, engines, keep_alive=True):
+    created = iter(engines)
+    fake_module = SimpleNamespace(
+        connect_matlab=lambda name: next(created),
+        EngineError=RuntimeError,
+    )
+    monkeypatch.setattr(matlab_interface, "_ensure_matlab_engine", lambda: fake_module)
+    monkeypatch.setattr(matlab_interface, "_ENGINE_CACHE", {})
+    request = matlab_interface.MatlabLaunchRequest(
+        engine_name="slap2", entry_point="slap2_launcher", keep_engine_alive=keep_alive
+    )
+    return request
+
+
+def test_connect_shared_engine_reuses_live_connection(monkeypatch):
+    first, second = _FakeEngine(), _FakeEngine()
+    request = _connect_with(monkeypatch, [first, second])
+
+    assert matlab_interface.connect_shared_engine(request) is first
+    matlab_interface.cleanup_engine(first, None, keep_alive=True)
+    assert first.quit_calls == 0
+    assert matlab_interface.connect_shared_engine(request) is first
+
+    first.alive = False
+    assert matlab_interface.connect_shared_engine(request) is second
+
+
+def test_cleanup_engine_without_keep_alive_disconnects(monkeypatch):
+    first, second = _FakeEngine(), _FakeEngine()
+    request = _connect_with(monkeypatch, [first, second])
+
+    assert matlab_interface.connect_shared_engine(request) is first
+    matlab_interface.cleanup_engine(first, None, keep_alive=False)
+    assert first.quit_calls == 1
+    assert matlab_interface.connect_shared_engine(request) is second
+
+
+def test_connect_shared_engine_not_cached_without_keep_alive(monkeypatch):
+    first, second = _FakeEngine(), _FakeEngine()
+    request = _connect_with(monkeypatch, [first, second], keep_alive=False)
+
+    assert matlab_interface.connect_shared_engine(request) is first
+    assert matlab_interface.connect_shared_engine(request) is second
@@ -49,3 +49,13 @@ def test_load_parameters_prompt_custom(monkeypatch):
         prompt_func=lambda prompt, default: int(input(prompt)) if default == 0 else input(prompt)
     )
     assert params["foo"] == 42
+
+
+def test_get_user_input_noninteractive_skips_prompt(monkeypatch):
+    def _fail(prompt):
+        raise AssertionError("input() should not be called in non-interactive mode")
+
+    monkeypatch.setattr("builtins.input", _fail)
+    monkeypatch.setenv(param_utils.NONINTERACTIVE_ENV_VAR, "1")
+    assert param_utils.get_user_input("Retry?", default="r") == "r"
+    assert param_utils.get_user_input("Count", default="3", cast_func=int) == 3
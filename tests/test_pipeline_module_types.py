@@ -68,3 +68,18 @@ def test_pre_acquisition_pipeline_launcher_and_script_modules(tmp_path, monkeypa
     assert weight_file.exists(), 'mouse_weight_pre_prompt should create weight file'
     script_flag = Path(session_folder) / 'script_module_flag.txt'
     assert script_flag.exists(), 'script_module should create flag file'
+
+
+def test_mouse_weight_post_prompt_writes_header_only_for_new_file(tmp_path, monkeypatch):
+    from openscope_experimental_launcher.post_acquisition import mouse_weight_post_prompt
+
+    monkeypatch.setattr('openscope_experimental_launcher.utils.param_utils.get_user_input', lambda *a, **k: 24.5)
+    param_file = tmp_path / 'params.json'
+    param_file.write_text(json.dumps({"output_session_folder": str(tmp_path)}))
+
+    assert mouse_weight_post_prompt.run_post_acquisition(str(param_file)) == 0
+    assert mouse_weight_post_prompt.run_post_acquisition(str(param_file)) == 0
+
+    lines = (tmp_path / 'mouse_weight.csv').read_text().splitlines()
+    assert lines[0] == "timestamp,stage,weight_g"
+    assert [line.split(",", 1)[1] for line in lines[1:]] == ["post,24.5", "post,24.5"]
@@ -233,3 +233,228 @@ def test_session_archiver_always_includes_instrument_json_with_routing_manifest(
     # instrument.json must be copied to network despite being omitted from routing manifest.
     assert (network_dir / "instrument.json").exists()
     assert (network_dir / "instrument.json").read_text(encoding="utf-8").strip() == '{"instrument": true}'
+
+
+def test_session_archiver_reuses_source_digest_while_unchanged(tmp_path, monkeypatch):
+    import hashlib
+
+    source = tmp_path / "data.bin"
+    source.write_bytes(b"payload" * 1000)
+    archiver = session_archiver.SessionArchiver(
+        tmp_path, tmp_path / "network", tmp_path / "backup",
+        manifest_path=tmp_path / "manifest.json",
+    )
+
+    hashed = []
+    compute = archiver._compute_digest
+    monkeypatch.setattr(archiver, "_compute_digest", lambda path: hashed.append(path) or compute(path))
+
+    expected = hashlib.sha256(source.read_bytes()).hexdigest()
+    assert archiver._source_digest(source) == expected
+    assert archiver._source_digest(source) == expected
+    assert hashed == [source]
+
+    source.write_bytes(b"changed")
+    os.utime(source, ns=(0, source.stat().st_mtime_ns + 1_000_000_000))
+    assert archiver._source_digest(source) == hashlib.sha256(b"changed").hexdigest()
+
+
+def test_session_archiver_hashes_source_while_copying(tmp_path, monkeypatch):
+    import hashlib
+
+    source = tmp_path / "data.bin"
+    payload = os.urandom(3 * 1024 * 1024 + 17)
+    source.write_bytes(payload)
+    os.utime(source, (1_000_000, 1_000_000))
+    dest = tmp_path / "network" / "data.bin"
+    archiver = session_archiver.SessionArchiver(
+        tmp_path, tmp_path / "network", tmp_path / "backup",
+        manifest_path=tmp_path / "manifest.json",
+    )
+
+    hashed = []
+    compute = archiver._compute_digest
+    monkeypatch.setattr(archiver, "_compute_digest", lambda path: hashed.append(path) or compute(path))
+
+    digest = archiver._copy_with_temp(source, dest)
+    assert digest == hashlib.sha256(payload).hexdigest()
+    assert archiver._verify_checksum(digest, source, dest) == digest
+    assert hashed == [dest]
+    assert dest.read_bytes() == payload
+    assert dest.stat().st_mtime == 1_000_000
+    assert [p.name for p in dest.parent.iterdir()] == ["data.bin"]
+
+    dest.write_bytes(b"corrupt")
+    with pytest.raises(IOError):
+        archiver._verify_checksum(digest, source, dest)
+
+
+def test_session_archiver_digest_fallback_matches_file_digest(tmp_path, monkeypatch):
+    import hashlib
+
+    source = tmp_path / "data.bin"
+    payload = os.urandom(2 * 1024 * 1024 + 5)
+    source.write_bytes(payload)
+    archiver = session_archiver.SessionArchiver(
+        tmp_path, tmp_path / "network", tmp_path / "backup",
+        manifest_path=tmp_path / "manifest.json",
+    )
+
+    expected = hashlib.sha256(payload).hexdigest()
+    assert archiver._compute_digest(source) == expected
+    monkeypatch.setattr(session_archiver, "file_digest", None)
+    assert archiver._compute_digest(source, chunk_size=4096) == expected
+
+
+def test_session_archiver_parallel_workers_record_every_file(tmp_path):
+    session_dir = tmp_path / "session"
+    session_dir.mkdir()
+    for index in range(12):
+        (session_dir / f"file{index}.bin").write_bytes(os.urandom(1024) * (index + 1))
+
+    archiver = session_archiver.SessionArchiver(
+        session_dir, tmp_path / "network", tmp_path / "backup",
+        manifest_path=tmp_path / "manifest.json",
+        max_workers=4,
+    )
+    archiver.run()
+
+    assert (archiver.successful, archiver.failed, archiver.deferred) == (12, 0, 0)
+    manifest = json.loads((tmp_path / "manifest.json").read_text(encoding="utf-8"))
+    assert {meta["status"] for meta in manifest["files"].values()} == {"complete"}
+    assert len(manifest["files"]) == 12
+    for index in range(12):
+        name = f"file{index}.bin"
+        assert (tmp_path / "network" / name).read_bytes() == (session_dir / name).read_bytes()
+
+
+def test_session_archiver_interrupt_skips_queued_files(tmp_path):
+    import threading
+    import time
+
+    session_dir = tmp_path / "session"
+    session_dir.mkdir()
+    for index in range(20):
+        (session_dir / f"file{index}.bin").write_bytes(b"x" * 64)
+
+    archiver = session_archiver.SessionArchiver(
+        session_dir, tmp_path / "network", tmp_path / "backup",
+        manifest_path=tmp_path / "manifest.json",
+        max_workers=2,
+    )
+    original = archiver._archive_file
+    calls = []
+    lock = threading.Lock()
+
+    def interrupting_archive(file_path, rel_path):
+        with lock:
+            calls.append(rel_path)
+            first = len(calls) == 1
+        if first:
+            raise KeyboardInterrupt
+        time.sleep(0.05)
+        return original(file_path, rel_path)
+
+    archiver._archive_file = interrupting_archive
+    with pytest.raises(KeyboardInterrupt):
+        archiver.run()
+
+    assert len(calls) < 20
+    archived = list((tmp_path / "network").glob("*.bin")) if (tmp_path / "network").exists() else []
+    assert len(archived) < 20
+
+
+def test_session_archiver_skips_its_own_journal(tmp_path):
+    session_dir = tmp_path / "session"
+    metadata_dir = session_dir / "launcher_metadata"
+    metadata_dir.mkdir(parents=True)
+    (session_dir / "data.bin").write_bytes(b"payload")
+    (metadata_dir / "session_archiver_manifest.jsonl").write_text("", encoding="utf-8")
+    (metadata_dir / ".manifest_abc123.json").write_text("{}", encoding="utf-8")
+    (metadata_dir / "other.jsonl").write_text("{}\n", encoding="utf-8")
+
+    archiver = session_archiver.SessionArchiver(
+        session_dir, tmp_path / "network", tmp_path / "backup",
+        manifest_path=metadata_dir / "session_archiver_manifest.json",
+    )
+    rel_paths = {path.relative_to(session_dir).as_posix() for path in archiver._iter_session_files()}
+
+    assert rel_paths == {"data.bin", "launcher_metadata/other.jsonl"}
+
+
+def test_session_archiver_journals_results_between_checkpoints(tmp_path, monkeypatch):
+    monkeypatch.setattr(session_archiver, "_MANIFEST_CHECKPOINT_INTERVAL", 3)
+    manifest_path = tmp_path / "meta" / "manifest.json"
+    journal_path = manifest_path.with_suffix(".jsonl")
+
+    def make_archiver():
+        return session_archiver.SessionArchiver(
+            tmp_path, tmp_path / "network", tmp_path / "backup", manifest_path=manifest_path,
+        )
+
+    archiver = make_archiver()
+    persisted = []
+    persist = archiver._persist_manifest
+    monkeypatch.setattr(archiver, "_persist_manifest", lambda: persisted.append(1) or persist())
+
+    for index in range(4):
+        archiver._mark_file(f"file{index}", status="complete")
+    assert len(persisted) == 1
+    assert len(journal_path.read_text(encoding="utf-8").splitlines()) == 1
+
+    # Simulate a crash: the last result exists only in the journal (plus a torn line).
+    archiver._journal.close()
+    with journal_path.open("a", encoding="utf-8") as handle:
+        handle.write('{"key": "file9", "ent')
+    resumed = make_archiver()
+    assert set(resumed._manifest["files"]) == {"file0", "file1", "file2", "file3"}
+    assert not journal_path.exists()
+
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    assert set(manifest["files"]) == {"file0", "file1", "file2", "file3"}
+
+
+def test_session_archiver_skips_recopy_when_destination_matches(tmp_path, monkeypatch):
+    session_dir = tmp_path / "session"
+    session_dir.mkdir()
+    (session_dir / "data.bin").write_bytes(b"payload" * 100)
+
+    def make_archiver(checksum_algo="sha256"):
+        return session_archiver.SessionArchiver(
+            session_dir, tmp_path / "network", tmp_path / "backup",
+            manifest_path=tmp_path / "manifest.json",
+            skip_completed=False,
+            checksum_algo=checksum_algo,
+        )
+
+    make_archiver().run()
+    first = json.loads((tmp_path / "manifest.json").read_text(encoding="utf-8"))["files"]["data.bin"]
+    assert first["src_size"] == 700 and "src_mtime_ns" in first
+    assert first["checksum_algo"] == "sha256"
+
+    archiver = make_archiver()
+    monkeypatch.setattr(archiver, "_copy_with_temp", lambda *a: pytest.fail("network copy repeated"))
+    archiver.run()
+    second = json.loads((tmp_path / "manifest.json").read_text(encoding="utf-8"))["files"]["data.bin"]
+    assert second["status"] == "complete"
+    assert second["network_skipped_reason"] == "stat_match"
+    assert second["checksum"] == first["checksum"]
+
+    # A different checksum algorithm does not reuse the recorded digest.
+    copied = []
+    archiver = make_archiver("md5")
+    copy = archiver._copy_with_temp
+    monkeypatch.setattr(archiver, "_copy_with_temp", lambda src, dest: copied.append(src) or copy(src, dest))
+    archiver.run()
+    third = json.loads((tmp_path / "manifest.json").read_text(encoding="utf-8"))["files"]["data.bin"]
+    assert copied and third["checksum_algo"] == "md5"
+    assert third["checksum"] != first["checksum"] and "network_skipped_reason" not in third
+
+    # A changed source is copied again.
+    (session_dir / "data.bin").write_bytes(b"changed")
+    copied = []
+    archiver = make_archiver()
+    copy = archiver._copy_with_temp
+    monkeypatch.setattr(archiver, "_copy_with_temp", lambda src, dest: copied.append(src) or copy(src, dest))
+    archiver.run()
+    assert copied and (tmp_path / "network" / "data.bin").read_bytes() == b"changed"
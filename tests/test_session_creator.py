@@ -132,5 +132,21 @@ class TestSessionCreator:
         assert creator.end_state["subject_id"] == "test_subject"
         assert creator.launcher_metadata == {}
 
+    def test_launcher_software_built_once_per_load(self, tmp_path):
+        """Software entry is reused across stream builds and rebuilt on reload."""
+        pytest.importorskip("aind_data_schema")
+        from datetime import datetime
+        self.create_test_files(tmp_path)
+        creator = SessionCreator(str(tmp_path))
+        creator.load_experiment_data()
+        start = datetime(2024, 1, 1, 10)
+        first = creator._get_data_streams(start, start)
+        second = creator._get_data_streams(start, start)
+        assert first and second
+        software = creator._launcher_software
+        assert creator._launcher_software is software
+        creator.load_experiment_data()
+        assert creator._launcher_software is not software
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -110,6 +110,25 @@ class TestUtilityIntegration:
         repo_path = git_manager.get_repository_path(params)
         assert repo_path is not None
 
+    def test_package_exports_are_lazy(self):
+        """Importing a utility does not import the launchers; exports still resolve on access."""
+        import sys
+        src = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+        code = (
+            "import sys\n"
+            "from openscope_experimental_launcher.utils import param_utils\n"
+            "assert 'openscope_experimental_launcher.launchers.base_launcher' not in sys.modules\n"
+            "assert 'requests' not in sys.modules\n"
+            "assert 'importlib.metadata' not in sys.modules\n"
+            "import openscope_experimental_launcher as pkg\n"
+            "assert pkg.BaseLauncher.__name__ == 'BaseLauncher'\n"
+            "assert isinstance(pkg.__version__, str)\n"
+            "assert pkg.utils.github_issue_reporter.__name__.endswith('github_issue_reporter')\n"
+        )
+        env = dict(os.environ, PYTHONPATH=src + os.pathsep + os.environ.get('PYTHONPATH', ''))
+        result = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+
 
 # Keep the BonsaiInterface tests but update them for functional approach
 class TestBonsaiInterface:
@@ -133,3 +152,89 @@ class TestBonsaiInterface:
         assert "-p" in args
         assert "TestParam1=value1" in args
         assert "TestParam2=42" in args
+
+    def test_start_workflow_uses_binary_block_buffered_pipes(self, tmp_path):
+        """start_workflow should request large binary pipes from Popen."""
+        from openscope_experimental_launcher.interfaces import bonsai_interface
+
+        workflow = tmp_path / "workflow.bonsai"
+        workflow.write_text("<Workflow />")
+        exe = tmp_path / "Bonsai.exe"
+        exe.write_text("")
+
+        with patch('subprocess.Popen') as mock_popen, \
+             patch.object(bonsai_interface, '_enlarge_pipe_buffers') as mock_enlarge:
+            bonsai_interface.start_workflow(str(workflow), str(exe))
+
+        kwargs = mock_popen.call_args.kwargs
+        assert kwargs['bufsize'] == bonsai_interface.PIPE_BUFFER_SIZE
+        assert 'universal_newlines' not in kwargs and 'text' not in kwargs
+        mock_enlarge.assert_called_once_with(mock_popen.return_value)
+
+
+class TestPythonInterface:
+    """Test python_interface utility functions."""
+
+    def test_check_installation_verifies_each_interpreter_once(self):
+        """The version probe is spawned once per interpreter and never for our own."""
+        import sys
+        from openscope_experimental_launcher.interfaces import python_interface
+
+        completed = subprocess.CompletedProcess(args=[], returncode=0, stdout="Python 3.x", stderr="")
+        with patch.object(python_interface, '_VERIFIED_INTERPRETERS', set()), \
+             patch('subprocess.run', return_value=completed) as mock_run:
+            assert python_interface.check_installation(sys.executable)
+            mock_run.assert_not_called()
+
+            assert python_interface.check_installation('/opt/other/python')
+            assert python_interface.check_installation('/opt/other/python')
+            mock_run.assert_called_once()
+
+    def test_check_installation_failure_not_cached(self):
+        """A failed probe is retried on the next call."""
+        from openscope_experimental_launcher.interfaces import python_interface
+
+        with patch.object(python_interface, '_VERIFIED_INTERPRETERS', set()), \
+             patch('subprocess.run', side_effect=FileNotFoundError) as mock_run:
+            assert not python_interface.check_installation('/missing/python')
+            assert not python_interface.check_installation('/missing/python')
+        assert mock_run.call_count == 2
+
+    def test_venv_python_used_without_activate_script(self, temp_dir):
+        """A venv with an interpreter but no activate script still runs its own Python."""
+        from openscope_experimental_launcher.interfaces import python_interface
+
+        venv = os.path.join(temp_dir, 'venv')
+        os.makedirs(os.path.join(venv, 'bin'))
+        for name in ('pyvenv.cfg', 'bin/python'):
+            open(os.path.join(venv, name), 'w').close()
+        script = os.path.join(temp_dir, 'script.py')
+        open(script, 'w').close()
+
+        with patch.object(python_interface, '_VENV_CACHE', {}), \
+             patch('subprocess.Popen') as mock_popen:
+            python_interface.start_python_script(script, venv_path=venv)
+        assert mock_popen.call_args[0][0][0] == os.path.join(venv, 'bin', 'python')
+
+    def test_resolve_virtual_environment_cached_until_config_changes(self, temp_dir):
+        """A venv is probed once; later launches only stat pyvenv.cfg."""
+        from openscope_experimental_launcher.interfaces import python_interface
+
+        venv = os.path.join(temp_dir, 'venv')
+        for sub in ('bin', 'Scripts'):
+            os.makedirs(os.path.join(venv, sub))
+        for name in ('pyvenv.cfg', 'bin/activate', 'bin/python'):
+            open(os.path.join(venv, name), 'w').close()
+
+        with patch.object(python_interface, '_VENV_CACHE', {}):
+            expected = (os.path.join(venv, 'bin', 'python'), os.path.join(venv, 'bin'))
+            assert python_interface.resolve_virtual_environment(venv) == expected
+            with patch('os.path.exists') as mock_exists:
+                assert python_interface.resolve_virtual_environment(venv) == expected
+            mock_exists.assert_not_called()
+
+            cfg = os.path.join(venv, 'pyvenv.cfg')
+            os.utime(cfg, ns=(0, os.stat(cfg).st_mtime_ns + 1_000_000_000))
+            with patch('os.path.exists', wraps=os.path.exists) as mock_exists:
+                assert python_interface.resolve_virtual_environment(venv) == expected
+            assert mock_exists.called